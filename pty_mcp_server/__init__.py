@@ -6,6 +6,8 @@ __version__ = "4.0.0"
 
 def run():
     """Console entry point for uvx installation"""
+    # Keep these imports local: importing the package (e.g. for __version__)
+    # must not pull in asyncio, the MCP SDK or the session backends
     import asyncio
     from .server import main
     
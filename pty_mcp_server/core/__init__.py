@@ -2,6 +2,13 @@
 PTY MCP Core - Domain logic and business entities
 """
 
-from .manager import SessionManager
+__all__ = ['SessionManager']
 
-__all__ = ['SessionManager']
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolve SessionManager on first access so importing a submodule of
+    # pty_mcp_server.core does not drag in the manager and its dependencies
+    if name == 'SessionManager':
+        from .manager import SessionManager
+        return SessionManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
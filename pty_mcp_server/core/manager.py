@@ -2,19 +2,30 @@
 Session Manager - Coordinates all session types for PTY MCP Server
 """
 
-import json
-from typing import Optional, Dict, Any
-import sys
-from pathlib import Path
-
-from pty_mcp_server.core.sessions.pty import PTYSession
-from pty_mcp_server.core.sessions.process import ProcessSession
-from pty_mcp_server.core.sessions.socket import SocketSession
-from pty_mcp_server.core.sessions.serial import SerialSession
-from pty_mcp_server.core.sessions.tmux import TmuxSessionManager
+import importlib
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
 from pty_mcp_server.lib.config import ProjectConfig
 from pty_mcp_server.lib.env_manager import ProjectEnvironmentManager
 
+if TYPE_CHECKING:
+    # Session modules are imported on first use of each session type
+    from pty_mcp_server.core.sessions.pty import PTYSession
+    from pty_mcp_server.core.sessions.process import ProcessSession
+    from pty_mcp_server.core.sessions.socket import SocketSession
+    from pty_mcp_server.core.sessions.serial import SerialSession
+    from pty_mcp_server.core.sessions.tmux import TmuxSessionManager
+
+
+@dataclass(frozen=True)
+class ActiveProject:
+    """The project that relative paths and new sessions resolve against"""
+    __slots__ = ('name', 'path')
+    name: str
+    path: str
+
 
 class SessionManager:
     """Manages all active sessions (PTY, process, socket, serial, tmux) and project context"""
@@ -22,16 +33,19 @@ class SessionManager:
     def __init__(self, config=None):
         """Initialize with optional config. Sessions are created lazily on first access."""
         # Session storage - only one of each type allowed
-        self.pty_session: Optional[PTYSession] = None
-        self.proc_session: Optional[ProcessSession] = None
-        self.socket_session: Optional[SocketSession] = None
-        self.serial_session: Optional[SerialSession] = None
+        self.pty_session: Optional['PTYSession'] = None
+        self.proc_session: Optional['ProcessSession'] = None
+        self.socket_session: Optional['SocketSession'] = None
+        self.serial_session: Optional['SerialSession'] = None
 
         # Tmux session manager - supports multiple named sessions
-        self.tmux_manager: Optional[TmuxSessionManager] = None
+        self.tmux_manager: Optional['TmuxSessionManager'] = None
+
+        # Guards creation and teardown of the session slots above
+        self._lock = threading.Lock()
 
         # Project management
-        self.active_project: Optional[Dict[str, str]] = None
+        self.active_project: Optional[ActiveProject] = None
         self.projects_config: Dict[str, Any] = {}
 
         # Environment manager for project-specific environments
@@ -49,60 +63,73 @@ class SessionManager:
         # Convert loaded project name to dict format
         if self.config.active_project and self.config.active_project in self.projects_config:
             project_name = self.config.active_project
-            self.active_project = {
-                "name": project_name,
-                "path": self.projects_config[project_name]
-            }
+            self.active_project = ActiveProject(project_name, self.projects_config[project_name])
         else:
             self.active_project = None
+
+        if self.config.optimistic_session_warmup:
+            threading.Thread(target=self._warm_sessions, name="pty-mcp-warmup",
+                             daemon=True).start()
+    
+    def _warm_sessions(self):
+        """Create the PTY session ahead of the first connect call"""
+        self.get_pty_session()
     
     def save_active_project(self):
         """Save active project using config"""
         if self.active_project:
-            # Save only the project name (string), not the full dict
-            project_name = self.active_project.get("name") if isinstance(self.active_project, dict) else self.active_project
-            self.config.active_project = project_name
+            # Only the name is persisted; the path comes from the registry
+            self.config.active_project = self.active_project.name
             self.config.save()
     
-    def get_pty_session(self) -> PTYSession:
+    def _get_or_create(self, attr: str, module: str, class_name: str):
+        """Return the session stored in ``attr``, importing and creating it on first access"""
+        session = getattr(self, attr)
+        if session is None:
+            with self._lock:
+                # Another thread may have created it while we waited
+                session = getattr(self, attr)
+                if session is None:
+                    factory = getattr(importlib.import_module(module), class_name)
+                    session = factory()
+                    setattr(self, attr, session)
+        return session
+    
+    def get_pty_session(self) -> 'PTYSession':
         """Get or create PTY session"""
-        if not self.pty_session:
-            self.pty_session = PTYSession()
-        return self.pty_session
+        return self._get_or_create('pty_session', 'pty_mcp_server.core.sessions.pty', 'PTYSession')
     
-    def get_proc_session(self) -> ProcessSession:
+    def get_proc_session(self) -> 'ProcessSession':
         """Get or create process session"""
-        if not self.proc_session:
-            self.proc_session = ProcessSession()
-        return self.proc_session
+        return self._get_or_create('proc_session', 'pty_mcp_server.core.sessions.process', 'ProcessSession')
     
-    def get_socket_session(self) -> SocketSession:
+    def get_socket_session(self) -> 'SocketSession':
         """Get or create socket session"""
-        if not self.socket_session:
-            self.socket_session = SocketSession()
-        return self.socket_session
+        return self._get_or_create('socket_session', 'pty_mcp_server.core.sessions.socket', 'SocketSession')
     
-    def get_serial_session(self) -> SerialSession:
+    def get_serial_session(self) -> 'SerialSession':
         """Get or create serial session"""
-        if not self.serial_session:
-            self.serial_session = SerialSession()
-        return self.serial_session
+        return self._get_or_create('serial_session', 'pty_mcp_server.core.sessions.serial', 'SerialSession')
 
-    def get_tmux_manager(self) -> TmuxSessionManager:
+    def get_tmux_manager(self) -> 'TmuxSessionManager':
         """Get or create tmux session manager (supports multiple named sessions)"""
-        if not self.tmux_manager:
-            self.tmux_manager = TmuxSessionManager()
-        return self.tmux_manager
+        return self._get_or_create('tmux_manager', 'pty_mcp_server.core.sessions.tmux', 'TmuxSessionManager')
 
     def cleanup_all(self):
         """Clean up all active sessions"""
-        if self.pty_session:
-            self.pty_session.terminate()
-        if self.proc_session:
-            self.proc_session.terminate()
-        if self.socket_session:
-            self.socket_session.close()
-        if self.serial_session:
-            self.serial_session.close()
-        if self.tmux_manager:
-            self.tmux_manager.cleanup_all()
\ No newline at end of file
+        with self._lock:
+            if self.pty_session:
+                self.pty_session.terminate()
+                self.pty_session = None
+            if self.proc_session:
+                self.proc_session.terminate()
+                self.proc_session = None
+            if self.socket_session:
+                self.socket_session.close()
+                self.socket_session = None
+            if self.serial_session:
+                self.serial_session.close()
+                self.serial_session = None
+            if self.tmux_manager:
+                self.tmux_manager.cleanup_all()
+                self.tmux_manager = None
@@ -0,0 +1,27 @@
+"""
+Command-line resolution shared by the PTY and process sessions
+"""
+
+import os
+import shutil
+from typing import List, Optional, Tuple
+
+
+def resolve_command(command: str, args: Optional[List[str]] = None) -> Tuple[Optional[str], List[str]]:
+    """
+    Build the Popen executable and argv for a session command
+
+    Bare program names are looked up on PATH up front and the result is
+    passed as the executable, so the child starts without a PATH search.
+    argv[0] stays as given, so the program sees the name it was invoked
+    by ($0, login-shell detection). Names containing a path separator
+    resolve against the session's cwd; unknown programs get no executable
+    so Popen reports them.
+
+    Returns:
+        (executable or None, argv)
+    """
+    executable = None
+    if os.sep not in command:
+        executable = shutil.which(command)
+    return executable, [command, *(args or ())]
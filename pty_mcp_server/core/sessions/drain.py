@@ -0,0 +1,45 @@
+"""
+Shared read loop for sessions backed by a non-blocking file descriptor
+"""
+
+import os
+import selectors
+from typing import Optional
+
+READ_CHUNK = 65536
+
+
+def drain(fd: int, sel: selectors.BaseSelector, timeout: float,
+          scratch: Optional[memoryview] = None) -> bytearray:
+    """
+    Read from fd until it stays quiet for timeout seconds or reaches EOF
+
+    Each wakeup drains everything already queued before waiting again, so a
+    burst of output costs one wait rather than one per chunk.
+
+    Args:
+        fd: Non-blocking descriptor registered with sel for EVENT_READ
+        sel: Selector to wait on
+        timeout: Seconds of silence that end the read
+        scratch: Writable buffer that chunks are read into; a session that
+            keeps one avoids allocating a bytes object for every chunk
+
+    Returns:
+        The raw bytes read, possibly empty
+    """
+    if scratch is None:
+        scratch = memoryview(bytearray(READ_CHUNK))
+    buf = bytearray()
+    while sel.select(timeout):
+        while True:
+            try:
+                n = os.readv(fd, [scratch])
+            except BlockingIOError:
+                break
+            except OSError:
+                # EIO from a PTY master once the child side has closed
+                return buf
+            if not n:
+                return buf
+            buf += scratch[:n]
+    return buf
@@ -2,30 +2,39 @@
 Regular process session management (without PTY)
 """
 
+import os
+import codecs
 import subprocess
-import select
+import selectors
 from typing import List, Optional
 
+from pty_mcp_server.core.sessions.command import resolve_command
+from pty_mcp_server.core.sessions.drain import READ_CHUNK, drain
+
 
 class ProcessSession:
     """Manages a regular process (without PTY)"""
     
+    __slots__ = ('process', '_out_fd', '_sel', '_scratch', '_dec')
+    
     def __init__(self):
         self.process = None
+        self._out_fd = None
+        self._sel = None
+        # Reused by every read() so draining does not allocate per chunk
+        self._scratch = memoryview(bytearray(READ_CHUNK))
+        # Per process; keeps a character split across two read() calls intact
+        self._dec = None
         
     def start(self, command: str, args: List[str] = None, working_dir: str = None):
         """Start a process"""
         if self.process:
             raise RuntimeError("Process already active")
         
-        # Prepare command
-        if args:
-            cmd_list = [command] + args
-        else:
-            cmd_list = [command]
-        
+        executable, argv = resolve_command(command, args)
         self.process = subprocess.Popen(
-            cmd_list,
+            argv,
+            executable=executable,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -34,6 +43,13 @@ class ProcessSession:
             bufsize=1
         )
         
+        # read() drains stdout with os.read; never block on an empty pipe
+        self._out_fd = self.process.stdout.fileno()
+        os.set_blocking(self._out_fd, False)
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._out_fd, selectors.EVENT_READ)
+        self._dec = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
         return True
     
     def send(self, data: str):
@@ -41,9 +57,9 @@ class ProcessSession:
         if not self.process:
             raise RuntimeError("No active process")
         
-        self.process.stdin.write(data)
-        if not data.endswith('\n'):
-            self.process.stdin.write('\n')
+        # One write per send: the line and its terminator reach the pipe together
+        payload = data if data.endswith('\n') else data + '\n'
+        self.process.stdin.write(payload)
         self.process.stdin.flush()
         return True
     
@@ -52,19 +68,26 @@ class ProcessSession:
         if not self.process:
             raise RuntimeError("No active process")
         
-        # Non-blocking read
-        output = ""
-        while True:
-            ready, _, _ = select.select([self.process.stdout], [], [], timeout)
-            if not ready:
-                break
-            line = self.process.stdout.readline()
-            if line:
-                output += line
-            else:
-                break
-        
-        return output
+        # Collect raw bytes until the pipe stays quiet for `timeout` or hits EOF
+        data = drain(self._out_fd, self._sel, timeout, self._scratch)
+        return self._dec.decode(data, final=False)
+    
+    def reap(self):
+        """Close the pipes of an exited process, collect its status and drop it"""
+        if self.process:
+            self._sel.close()
+            self._sel = None
+            # Drop any partial character; the next start() gets a new decoder
+            self._dec.decode(b'', final=True)
+            for pipe in (self.process.stdin, self.process.stdout, self.process.stderr):
+                if pipe:
+                    try:
+                        pipe.close()
+                    except OSError:
+                        pass
+            self.process.wait()
+            self.process = None
+        return True
     
     def terminate(self):
         """Terminate the process"""
@@ -74,7 +97,7 @@ class ProcessSession:
                 self.process.wait(timeout=2)
             except subprocess.TimeoutExpired:
                 self.process.kill()
-            self.process = None
+            self.reap()
         return True
     
     def is_active(self) -> bool:
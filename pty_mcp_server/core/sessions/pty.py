@@ -4,35 +4,50 @@ PTY (Pseudo-Terminal) session management
 
 import os
 import pty
+import codecs
 import subprocess
-import select
-import fcntl
+import selectors
 import re
+import time
 from typing import List, Optional
 
+from pty_mcp_server.core.sessions.command import resolve_command
+from pty_mcp_server.core.sessions.drain import READ_CHUNK, drain
+
 
 class PTYSession:
     """Manages a PTY (pseudo-terminal) session"""
     
+    __slots__ = ('master_fd', 'slave_fd', 'process', '_sel', '_scratch', '_dec')
+    
+    # Mode set/reset (incl. bracketed paste ?2004h/l), clear line, clear
+    # screen and cursor home; colors are kept
+    _ESC_RE = re.compile(r'\x1b\[(?:\?[0-9]+[hl]|[KJH])')
+    # Same pattern for raw output; ESC never occurs inside a UTF-8 multi-byte
+    # sequence, so stripping before decoding is safe
+    _ESC_RE_BYTES = re.compile(rb'\x1b\[(?:\?[0-9]+[hl]|[KJH])')
+    # Output ending in a typical shell/REPL prompt character
+    _PROMPT_RE = re.compile(r'[$#>%:]\s*$')
+    
     def __init__(self):
         self.master_fd = None
         self.slave_fd = None
         self.process = None
+        self._sel = None
+        # Reused by every read() so draining does not allocate per chunk
+        self._scratch = memoryview(bytearray(READ_CHUNK))
+        # Per session; keeps a character split across two read() calls intact
+        self._dec = None
     
     @staticmethod
     def clean_output(text: str) -> str:
         """Remove common terminal escape sequences for cleaner output"""
-        # Remove bracketed paste mode sequences
-        text = text.replace('\x1b[?2004h', '')  # Enable bracketed paste
-        text = text.replace('\x1b[?2004l', '')  # Disable bracketed paste
-        
-        # Remove other common escape sequences but keep colors
-        text = re.sub(r'\x1b\[\?[0-9]+[hl]', '', text)  # Mode sequences
-        text = re.sub(r'\x1b\[K', '', text)  # Clear line
-        text = re.sub(r'\x1b\[J', '', text)  # Clear screen
-        text = re.sub(r'\x1b\[H', '', text)  # Home cursor
-        
-        return text
+        # Plain output (the common case) has no ESC at all; the substring
+        # test is a C-level scan, much cheaper than running the regex
+        if '\x1b' not in text:
+            return text
+        # One pass over the text with a single precompiled pattern
+        return PTYSession._ESC_RE.sub('', text)
         
     def start(self, command: str, args: List[str] = None, working_dir: str = None):
         """Start a PTY session with the given command"""
@@ -42,24 +57,24 @@ class PTYSession:
         # Create PTY
         self.master_fd, self.slave_fd = pty.openpty()
         
-        # Make master non-blocking
-        flags = fcntl.fcntl(self.master_fd, fcntl.F_GETFL)
-        fcntl.fcntl(self.master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        # Make master non-blocking and register it once for every read()
+        os.set_blocking(self.master_fd, False)
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.master_fd, selectors.EVENT_READ)
+        self._dec = codecs.getincrementaldecoder('utf-8')(errors='replace')
         
-        # Prepare command
-        if args:
-            cmd_list = [command] + args
-        else:
-            cmd_list = [command] if command != 'bash' else ['/bin/bash']
+        executable, argv = resolve_command(command, args)
         
-        # Start process
+        # Start process in its own session. start_new_session does the setsid()
+        # in C, which (unlike a preexec_fn) lets subprocess use vfork/posix_spawn
         self.process = subprocess.Popen(
-            cmd_list,
+            argv,
+            executable=executable,
             stdin=self.slave_fd,
             stdout=self.slave_fd,
             stderr=self.slave_fd,
             cwd=working_dir,
-            preexec_fn=os.setsid
+            start_new_session=True
         )
         
         return True
@@ -81,23 +96,44 @@ class PTYSession:
         if not self.process:
             raise RuntimeError("No active PTY session")
         
+        # The incremental decoder holds back a trailing partial character
+        # until the next read() supplies the rest
+        buf = drain(self.master_fd, self._sel, timeout, self._scratch)
+        
+        # Clean escape sequences while the output is still one byte per
+        # code unit; a decoded str widens to 2-4 bytes per character as soon
+        # as it holds non-Latin-1 text
+        if b'\x1b' in buf:
+            buf = self._ESC_RE_BYTES.sub(b'', buf)
+        return self._dec.decode(buf, final=False)
+    
+    def wait_ready(self, timeout: float = 1.0, quiet: float = 0.1) -> str:
+        """
+        Collect a freshly started program's initial output
+        
+        Returns as soon as the output ends in a prompt, or once output has
+        started and then paused for quiet seconds, instead of always
+        waiting out the full timeout.
+        
+        Args:
+            timeout: Upper bound on the total wait
+            quiet: Silence after output that counts as ready
+        """
+        deadline = time.monotonic() + timeout
         output = ""
         while True:
-            ready, _, _ = select.select([self.master_fd], [], [], timeout)
-            if not ready:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-            
-            try:
-                data = os.read(self.master_fd, 4096)
-                if data:
-                    output += data.decode('utf-8', errors='replace')
-                else:
+            chunk = self.read(timeout=min(quiet, remaining))
+            if chunk:
+                output += chunk
+                if self._PROMPT_RE.search(output):
                     break
-            except OSError:
+            elif output or self.process.poll() is not None:
+                # Went quiet after printing something, or exited silently
                 break
-        
-        # Clean escape sequences from output
-        return self.clean_output(output)
+        return output
     
     def terminate(self):
         """Terminate the PTY session"""
@@ -109,6 +145,14 @@ class PTYSession:
                 self.process.kill()
             self.process = None
         
+        if self._sel:
+            self._sel.close()
+            self._sel = None
+        
+        if self._dec:
+            # Drop any partial character; the next start() gets a new decoder
+            self._dec.decode(b'', final=True)
+        
         if self.master_fd:
             os.close(self.master_fd)
             self.master_fd = None
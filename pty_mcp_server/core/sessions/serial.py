@@ -2,16 +2,21 @@
 Serial port connection management
 """
 
+import codecs
 from typing import Optional
 
 
 class SerialSession:
     """Manages serial port connections"""
     
+    __slots__ = ('serial', 'device', 'baudrate', '_dec')
+    
     def __init__(self):
         self.serial = None
         self.device = None
         self.baudrate = None
+        # Keeps a multi-byte character split across two reads intact
+        self._dec = codecs.getincrementaldecoder('utf-8')(errors='replace')
     
     def open(self, device: str, baudrate: int = 9600, **kwargs):
         """Open a serial port connection"""
@@ -50,28 +55,35 @@ class SerialSession:
         return sent
     
     def read(self, size: int = None, timeout: float = 1.0) -> str:
-        """Read from the serial port"""
+        """
+        Read from the serial port
+        
+        Without a size, returns whatever the driver has buffered, waiting up
+        to timeout for the first byte when nothing is buffered yet.
+        """
         if not self.serial:
             raise RuntimeError("Serial port not open")
         
-        old_timeout = self.serial.timeout
-        self.serial.timeout = timeout
+        # Changing the timeout reprograms the tty (VMIN/VTIME); only do it when needed
+        if self.serial.timeout != timeout:
+            self.serial.timeout = timeout
         
-        try:
-            if size:
-                data = self.serial.read(size)
+        if size:
+            data = self.serial.read(size)
+        else:
+            waiting = self.serial.in_waiting
+            if waiting:
+                data = self.serial.read(waiting)
             else:
-                data = self.serial.read_all()
-            
-            if data:
-                try:
-                    return data.decode('utf-8', errors='replace')
-                except UnicodeDecodeError:
-                    return data.hex()
-            else:
-                return "(no data received)"
-        finally:
-            self.serial.timeout = old_timeout
+                data = self.serial.read(1)
+                if data:
+                    # Pick up the rest of the burst the first byte belonged to
+                    data += self.serial.read(self.serial.in_waiting)
+        
+        if data:
+            return self._dec.decode(data, final=False)
+        else:
+            return "(no data received)"
     
     def close(self):
         """Close the serial port"""
@@ -80,6 +92,7 @@ class SerialSession:
             self.serial = None
             self.device = None
             self.baudrate = None
+            self._dec.reset()
         return True
     
     def is_active(self) -> bool:
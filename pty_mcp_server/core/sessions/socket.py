@@ -2,31 +2,51 @@
 Network socket connection management
 """
 
+import codecs
+import selectors
 import socket
+import time
 from typing import Optional
 
 
 class SocketSession:
     """Manages network socket connections"""
     
+    __slots__ = ('socket', 'host', 'port', '_dec', '_sel')
+    
     def __init__(self):
         self.socket = None
         self.host = None
         self.port = None
+        # Keeps a multi-byte character split across two recv() calls intact
+        self._dec = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._sel = None
         
     def open(self, host: str, port: int, protocol: str = 'tcp'):
-        """Open a socket connection"""
+        """
+        Open a socket connection
+        
+        TCP sockets disable Nagle's algorithm: interactive sends are small,
+        and Nagle holding them back while the peer delays its ACK can add
+        40-200 ms per round trip. Keepalive is enabled so a dead peer is
+        eventually noticed on an idle connection.
+        """
         if self.socket:
             raise RuntimeError("Socket already open")
         
         if protocol.lower() == 'tcp':
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         elif protocol.lower() == 'udp':
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         else:
             raise ValueError(f"Unknown protocol: {protocol}")
         
         self.socket.connect((host, port))
+        # Registered once; read() waits on it instead of setting a timeout per call
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.socket, selectors.EVENT_READ)
         self.host = host
         self.port = port
         return True
@@ -40,30 +60,88 @@ class SocketSession:
         return sent
     
     def read(self, timeout: float = 2.0) -> str:
-        """Read from the socket"""
+        """
+        Read from the socket
+        
+        Waits up to timeout for the socket to become readable, then drains
+        everything already buffered with non-blocking recv() calls so a
+        large response comes back in one read.
+        """
+        return self._read(timeout, None)
+    
+    def read_until_quiet(self, timeout: float = 2.0, quiet: float = 0.05) -> str:
+        """
+        Read a response that may arrive in several packets
+        
+        Waits up to timeout for the first data, then keeps reading until
+        the socket has been silent for quiet seconds, the peer closes, or
+        timeout has passed in total.
+        """
+        return self._read(timeout, quiet)
+    
+    def _read(self, timeout: float, quiet: Optional[float]) -> str:
+        """
+        Shared body of read() and read_until_quiet()
+        
+        Data that ends inside a UTF-8 sequence decodes to nothing until the
+        rest arrives, so waiting continues (up to timeout) until at least
+        one whole character is available; the leftover bytes stay in the
+        decoder for the next read.
+        """
         if not self.socket:
             raise RuntimeError("Socket not open")
         
-        self.socket.settimeout(timeout)
-        try:
-            data = self.socket.recv(4096)
-            if data:
-                try:
-                    return data.decode('utf-8')
-                except UnicodeDecodeError:
-                    return data.hex()
-            else:
-                return "(socket closed by remote)"
-        except socket.timeout:
-            return "(no data received within timeout)"
+        deadline = time.monotonic() + timeout
+        text = ""
+        closed = False
+        wait = timeout
+        while self._sel.select(wait):
+            buf = bytearray()
+            closed = self._drain(buf)
+            # Nothing more is coming after a close; surface any partial character
+            text += self._dec.decode(buf, final=closed)
+            if closed:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (text and quiet is None):
+                break
+            # Only part of a character so far: keep waiting for the rest
+            wait = min(quiet, remaining) if text else remaining
+        
+        if text:
+            return text
+        if closed:
+            return "(socket closed by remote)"
+        return "(no data received within timeout)"
+    
+    def _drain(self, buf: bytearray) -> bool:
+        """Append everything already received to buf; True if the peer closed"""
+        while True:
+            try:
+                chunk = self.socket.recv(65536, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return False
+            if not chunk:
+                return True
+            buf += chunk
     
     def close(self):
         """Close the socket"""
         if self.socket:
+            self._sel.close()
+            self._sel = None
+            # Send FIN and release the descriptor now rather than at GC time
+            try:
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                # Not connected, or the peer already went away
+                pass
             self.socket.close()
             self.socket = None
             self.host = None
             self.port = None
+            # Flush so a partial character never carries into the next connection
+            self._dec.decode(b'', final=True)
         return True
     
     def is_active(self) -> bool:
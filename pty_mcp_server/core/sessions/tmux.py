@@ -2,9 +2,32 @@
 Tmux session management - supports multiple named sessions
 """
 
+import re
 import subprocess
 import time
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+
+from pty_mcp_server.core.sessions.tmux_control import (
+    CONTROL_SESSION, TmuxControlClient, TmuxControlError, TmuxReplyLost
+)
+
+# Captures longer than this skip the control client: a direct tmux process
+# hands back one buffer instead of a reply split into per-line framing, and
+# other commands are not queued behind it
+CAPTURE_DIRECT_LINES = 10_000
+
+
+@functools.lru_cache(maxsize=1)
+def _tmux_version() -> Optional[Tuple[int, int]]:
+    """(major, minor) from ``tmux -V``, (0, 0) if unparseable, None if tmux is missing"""
+    try:
+        result = subprocess.run(["tmux", "-V"], capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    # e.g. "tmux 3.3a", "tmux next-3.4", "tmux master"
+    match = re.search(r"(\d+)\.(\d+)", result.stdout)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
 
 
 class TmuxSessionManager:
@@ -13,57 +36,128 @@ class TmuxSessionManager:
     def __init__(self):
         """Initialize tmux session manager"""
         self.sessions: Dict[str, Dict[str, Any]] = {}
+        # Commands go over one persistent control-mode client when possible
+        self._control = TmuxControlClient()
+        # session name -> monotonic time it was last confirmed to exist
+        self._exists_cache: Dict[str, float] = {}
+        self._exists_ttl = 0.2
 
     @staticmethod
     def check_tmux_installed() -> bool:
-        """Check if tmux is installed"""
-        try:
-            subprocess.run(["tmux", "-V"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if tmux is installed (probed once per process)"""
+        return _tmux_version() is not None
+
+    @staticmethod
+    def tmux_version() -> Optional[Tuple[int, int]]:
+        """Installed tmux version as (major, minor), or None if tmux is missing"""
+        return _tmux_version()
+
+    # tmux stderr when the target session/pane or the server itself is absent
+    _MISSING_TARGET = ("can't find", "no server running", "error connecting to")
+
+    @classmethod
+    def _is_missing_target(cls, stderr: str) -> bool:
+        """Whether a failed tmux command failed because its target does not exist"""
+        return any(marker in stderr for marker in cls._MISSING_TARGET)
+
+    @staticmethod
+    def _not_found(session_name: str) -> Dict[str, Any]:
+        """Result dict for an operation on a session that does not exist"""
+        return {
+            "success": False,
+            "error": f"Session '{session_name}' not found"
+        }
+
+    def _tmux(self, args: Sequence[str], direct: bool = False) -> subprocess.CompletedProcess:
+        """
+        Run a tmux command, preferring the control client over a new process
+
+        stdout/stderr are left as bytes; most calls only look at the
+        return code, so output is decoded only where it is used.
+
+        Args:
+            args: tmux command and arguments
+            direct: Always start a tmux process (for very large replies)
+        """
+        if not direct:
+            try:
+                return self._control.run(args)
+            except TmuxReplyLost as e:
+                # Already sent; running it again could repeat keys or sessions
+                return subprocess.CompletedProcess(["tmux", *args], 1, b"", str(e).encode())
+            except (TmuxControlError, ValueError):
+                # Control mode unavailable, or an argument it cannot carry
+                pass
+        return subprocess.run(["tmux", *args], capture_output=True)
+
+    @staticmethod
+    def _is_control_target(target: str) -> bool:
+        """Whether a target names the control client's helper session"""
+        session = target.lstrip("=").split(":", 1)[0].split(".", 1)[0]
+        return session == CONTROL_SESSION
+
+    @staticmethod
+    def _reserved() -> Dict[str, Any]:
+        """Result dict for an operation on the control client's helper session"""
+        return {
+            "success": False,
+            "error": f"Session name '{CONTROL_SESSION}' is reserved for the server's tmux connection"
+        }
 
     def session_exists(self, session_name: str) -> bool:
-        """Check if a tmux session exists"""
-        result = subprocess.run(
-            ["tmux", "has-session", "-t", session_name],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-
-    def start_session(self, session_name: str, command: str) -> Dict[str, Any]:
+        """Check if a tmux session exists (positive answers are reused for _exists_ttl seconds)"""
+        if self._is_control_target(session_name):
+            return False
+        confirmed = self._exists_cache.get(session_name)
+        if confirmed is not None and time.monotonic() - confirmed < self._exists_ttl:
+            return True
+
+        result = self._tmux(["has-session", "-t", session_name])
+        if result.returncode == 0:
+            self._exists_cache[session_name] = time.monotonic()
+            return True
+        self._exists_cache.pop(session_name, None)
+        return False
+
+    def start_session(self, session_name: str, command: str,
+                      working_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Start a new detached tmux session
 
         Args:
             session_name: Unique name for the session
             command: Command to run in the session
+            working_dir: Start directory (defaults to the server's cwd)
 
         Returns:
             Dict with success status and info
         """
-        # Check if session already exists
-        if self.session_exists(session_name):
-            return {
-                "success": False,
-                "error": f"Session '{session_name}' already exists"
-            }
+        if self._is_control_target(session_name):
+            return self._reserved()
 
-        # Start new detached session
-        result = subprocess.run(
-            ["tmux", "new-session", "-d", "-s", session_name, command],
-            capture_output=True,
-            text=True
-        )
+        # Start new detached session; tmux itself refuses a name already in
+        # use, so no separate has-session round trip is needed
+        cmd = ["new-session", "-d", "-s", session_name]
+        if working_dir:
+            cmd.extend(["-c", working_dir])
+        cmd.append(command)
+        result = self._tmux(cmd)
 
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            if "duplicate session" in stderr:
+                self._exists_cache[session_name] = time.monotonic()
+                return {
+                    "success": False,
+                    "error": f"Session '{session_name}' already exists"
+                }
             return {
                 "success": False,
-                "error": f"Failed to create session: {result.stderr}"
+                "error": f"Failed to create session: {stderr}"
             }
 
         # Track session locally
+        self._exists_cache[session_name] = time.monotonic()
         self.sessions[session_name] = {
             "command": command,
             "created_at": int(time.time())
@@ -83,36 +177,26 @@ class TmuxSessionManager:
         Returns:
             List of session info dicts
         """
-        result = subprocess.run(
-            ["tmux", "list-sessions", "-F", "#{session_name}:#{session_created}"],
-            capture_output=True,
-            text=True
-        )
+        # One query for everything; session_attached is the attached client count.
+        # Tab-separated: tmux rewrites ':' in session names but never emits a tab
+        result = self._tmux(["list-sessions", "-F",
+                             "#{session_name}\t#{session_created}\t#{session_attached}"])
 
         if result.returncode != 0:
             return []
 
         sessions = []
-        for line in result.stdout.strip().split("\n"):
-            if line:
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    session_name = parts[0]
-                    created = parts[1]
-
-                    # Check if session is attached
-                    attached_result = subprocess.run(
-                        ["tmux", "list-clients", "-t", session_name],
-                        capture_output=True,
-                        text=True
-                    )
-                    is_attached = attached_result.returncode == 0 and attached_result.stdout.strip()
-
-                    sessions.append({
-                        "name": session_name,
-                        "created_at": created,
-                        "attached": is_attached
-                    })
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) == 3:
+                session_name, created, attached = parts
+                if session_name == CONTROL_SESSION:
+                    continue
+                sessions.append({
+                    "name": session_name,
+                    "created_at": created,
+                    "attached": attached != "0"
+                })
 
         return sessions
 
@@ -127,22 +211,19 @@ class TmuxSessionManager:
         Returns:
             Dict with success status
         """
-        if not self.session_exists(session_name):
-            return {
-                "success": False,
-                "error": f"Session '{session_name}' not found"
-            }
+        if self._is_control_target(session_name):
+            return self._reserved()
 
-        result = subprocess.run(
-            ["tmux", "send-keys", "-t", session_name, keys, "Enter"],
-            capture_output=True,
-            text=True
-        )
+        result = self._tmux(["send-keys", "-t", session_name, keys, "Enter"])
 
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            if self._is_missing_target(stderr):
+                self._exists_cache.pop(session_name, None)
+                return self._not_found(session_name)
             return {
                 "success": False,
-                "error": f"Failed to send keys: {result.stderr}"
+                "error": f"Failed to send keys: {stderr}"
             }
 
         return {
@@ -156,32 +237,34 @@ class TmuxSessionManager:
 
         Args:
             session_name: Session to capture from
-            lines: Optional number of lines to capture
+            lines: Optional number of history lines to capture; only the
+                visible pane is captured when omitted
 
         Returns:
             Dict with success status and captured output
         """
-        if not self.session_exists(session_name):
-            return {
-                "success": False,
-                "error": f"Session '{session_name}' not found"
-            }
+        if self._is_control_target(session_name):
+            return self._reserved()
 
-        cmd = ["tmux", "capture-pane", "-t", session_name, "-p"]
+        cmd = ["capture-pane", "-t", session_name, "-p"]
         if lines:
             cmd.extend(["-S", f"-{lines}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._tmux(cmd, direct=bool(lines) and lines > CAPTURE_DIRECT_LINES)
 
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            if self._is_missing_target(stderr):
+                self._exists_cache.pop(session_name, None)
+                return self._not_found(session_name)
             return {
                 "success": False,
-                "error": f"Failed to capture pane: {result.stderr}"
+                "error": f"Failed to capture pane: {stderr}"
             }
 
         return {
             "success": True,
-            "output": result.stdout,
+            "output": result.stdout.decode("utf-8", errors="replace"),
             "session_name": session_name
         }
 
@@ -195,11 +278,10 @@ class TmuxSessionManager:
         Returns:
             Dict with attach command info
         """
+        if self._is_control_target(session_name):
+            return self._reserved()
         if not self.session_exists(session_name):
-            return {
-                "success": False,
-                "error": f"Session '{session_name}' not found"
-            }
+            return self._not_found(session_name)
 
         return {
             "success": True,
@@ -218,26 +300,24 @@ class TmuxSessionManager:
         Returns:
             Dict with success status
         """
-        if not self.session_exists(session_name):
-            return {
-                "success": False,
-                "error": f"Session '{session_name}' not found"
-            }
+        if self._is_control_target(session_name):
+            return self._reserved()
 
-        result = subprocess.run(
-            ["tmux", "kill-session", "-t", session_name],
-            capture_output=True,
-            text=True
-        )
+        result = self._tmux(["kill-session", "-t", session_name])
 
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            if self._is_missing_target(stderr):
+                self._exists_cache.pop(session_name, None)
+                return self._not_found(session_name)
             return {
                 "success": False,
-                "error": f"Failed to kill session: {result.stderr}"
+                "error": f"Failed to kill session: {stderr}"
             }
 
         # Remove from local tracking
         self.sessions.pop(session_name, None)
+        self._exists_cache.pop(session_name, None)
 
         return {
             "success": True,
@@ -247,5 +327,7 @@ class TmuxSessionManager:
     def cleanup_all(self):
         """Clean up all tracked sessions (for shutdown)"""
         # Don't actually kill sessions - they should persist
-        # Just clear local tracking
+        # Just clear local tracking and detach the control client
         self.sessions.clear()
+        self._exists_cache.clear()
+        self._control.close()
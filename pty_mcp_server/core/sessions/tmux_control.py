@@ -0,0 +1,197 @@
+"""
+Persistent tmux control-mode client
+
+Runs tmux commands over one long-lived ``tmux -C`` connection instead of
+starting a new tmux process for every command.
+"""
+
+import os
+import selectors
+import subprocess
+import threading
+from typing import List, Sequence, Tuple
+
+# Helper session the control client attaches to; hidden from session listings
+CONTROL_SESSION = "__ptymcp_control"
+
+# Seconds to wait for tmux to answer a single command
+REPLY_TIMEOUT = 5.0
+
+
+class TmuxControlError(Exception):
+    """The control connection could not be started or stopped responding"""
+
+
+class TmuxReplyLost(TmuxControlError):
+    """A command was sent but its reply never arrived; it may have run"""
+
+
+def quote(arg: str) -> str:
+    """Quote one argument for the tmux command parser (sh-style single quotes)"""
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+class TmuxControlClient:
+    """
+    One ``tmux -C`` client shared by all commands
+
+    tmux answers each command with a block framed by ``%begin`` and
+    ``%end`` (or ``%error``) lines; everything outside a block is an
+    asynchronous notification and is skipped.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._sel = None
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+
+    def _start(self):
+        """Launch the control client and wait for it to attach"""
+        try:
+            self._proc = subprocess.Popen(
+                ["tmux", "-C", "new-session", "-A", "-s", CONTROL_SESSION],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            raise TmuxControlError(f"Could not start tmux control client: {e}")
+
+        fd = self._proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(fd, selectors.EVENT_READ)
+
+        # tmux reads stdin before running the new-session from argv; wait for
+        # that first reply so later commands can see the helper session
+        self._read_block()
+
+        # The helper session goes away with its last control client
+        self._command(["set-option", "-t", CONTROL_SESSION, "destroy-unattached", "on"])
+
+    def _readline(self) -> bytes:
+        """Next line of control-mode output, without its line ending"""
+        while True:
+            end = self._buf.find(b"\n")
+            if end >= 0:
+                line = bytes(self._buf[:end])
+                del self._buf[:end + 1]
+                return line.rstrip(b"\r")
+            if not self._sel.select(REPLY_TIMEOUT):
+                raise TmuxControlError("tmux control client did not respond")
+            try:
+                data = os.read(self._proc.stdout.fileno(), 65536)
+            except BlockingIOError:
+                continue
+            if not data:
+                raise TmuxControlError("tmux control client exited")
+            self._buf += data
+
+    def _read_block(self) -> Tuple[bool, bool, bytes]:
+        """
+        Skip notifications and read the next reply block
+
+        Returns:
+            (sent by this client, succeeded, output)
+        """
+        while True:
+            line = self._readline()
+            if line.startswith(b"%exit"):
+                raise TmuxControlError("tmux control client exited")
+            if line.startswith(b"%begin "):
+                break
+
+        # Guard lines repeat the begin line's time, number and flags
+        tag = line[len(b"%begin "):]
+        end, error = b"%end " + tag, b"%error " + tag
+        lines: List[bytes] = []
+        while True:
+            line = self._readline()
+            if line == end or line == error:
+                break
+            lines.append(line)
+
+        output = b"".join(item + b"\n" for item in lines)
+        return tag.endswith(b" 1"), line == end, output
+
+    def _command(self, args: Sequence[str]) -> subprocess.CompletedProcess:
+        """Send one command and collect its reply block"""
+        self._send(args)
+        return self._reply(args)
+
+    def _send(self, args: Sequence[str]):
+        """Write one command line to the client"""
+        line = " ".join(quote(arg) for arg in args) + "\n"
+        try:
+            self._proc.stdin.write(line.encode("utf-8"))
+            self._proc.stdin.flush()
+        except OSError as e:
+            raise TmuxControlError(f"tmux control client closed: {e}")
+
+    def _reply(self, args: Sequence[str]) -> subprocess.CompletedProcess:
+        """Read the reply block for the command just sent"""
+        while True:
+            ours, ok, output = self._read_block()
+            # Flags are 1 for commands sent by this client; skip the rest
+            if not ours:
+                continue
+            if ok:
+                return subprocess.CompletedProcess(["tmux", *args], 0, output, b"")
+            return subprocess.CompletedProcess(["tmux", *args], 1, b"", output)
+
+    def run(self, args: Sequence[str]) -> subprocess.CompletedProcess:
+        """
+        Run a tmux command, e.g. ``["has-session", "-t", "name"]``
+
+        Returns:
+            CompletedProcess with bytes stdout/stderr, like subprocess.run
+
+        Raises:
+            TmuxControlError: The command was not sent because the control
+                client is unavailable; it is safe to run it another way
+            TmuxReplyLost: The command was sent but no reply came back, so
+                it may have run and must not be retried
+            The connection is dropped either way and restarted on the next call.
+        """
+        if any("\n" in arg for arg in args):
+            raise ValueError("tmux control commands cannot contain newlines")
+        with self._lock:
+            try:
+                if self._proc is None:
+                    self._start()
+                self._send(args)
+            except TmuxControlError:
+                self._close()
+                raise
+            try:
+                return self._reply(args)
+            except TmuxControlError as e:
+                self._close()
+                raise TmuxReplyLost(str(e)) from e
+
+    def _close(self):
+        """Detach and reap the client; caller holds the lock"""
+        if self._proc is None:
+            return
+        if self._sel:
+            self._sel.close()
+            self._sel = None
+        try:
+            # EOF on stdin detaches the client
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc.stdout.close()
+        self._proc = None
+        self._buf.clear()
+
+    def close(self):
+        """Detach the control client"""
+        with self._lock:
+            self._close()
@@ -2,7 +2,16 @@
 PTY MCP Refactored - Library Module
 """
 
-from .base import BaseTool, ToolResult
-from .registry import ToolRegistry
+__all__ = ['BaseTool', 'ToolResult', 'ToolRegistry']
 
-__all__ = ['BaseTool', 'ToolResult', 'ToolRegistry']
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolve the re-exports on first access so importing a helper such as
+    # pty_mcp_server.lib.fastjson does not load the base classes and registry
+    if name in ('BaseTool', 'ToolResult'):
+        from . import base
+        return getattr(base, name)
+    if name == 'ToolRegistry':
+        from .registry import ToolRegistry
+        return ToolRegistry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,15 +2,24 @@
 Base classes for PTY MCP tools
 """
 
+import sys
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from dataclasses import dataclass
-import json
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _mcp_text(text: str) -> Dict[str, Any]:
+    """MCP response carrying a single text item"""
+    return {"content": [{"type": "text", "text": text}]}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ToolResult:
-    """Standard result format for all tools"""
+    """Standard result format for all tools (immutable, so instances can be shared)"""
     success: bool
     content: str
     error: Optional[str] = None
@@ -19,23 +28,58 @@ class ToolResult:
     def to_mcp_response(self) -> Dict[str, Any]:
         """Convert to MCP protocol response format"""
         if self.success:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": self.content
-                }]
-            }
-        else:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Error: {self.error or self.content}"
-                }]
-            }
+            return _mcp_text(self.content)
+        return _mcp_text(f"Error: {self.error or self.content}")
+
+
+# Shared result for tools invoked without an injected session manager
+NO_SESSION_MGR = ToolResult(
+    success=False,
+    content="",
+    error="No session manager available"
+)
+
+
+# JSON Schema type -> (accepted Python types, wording for the error message)
+_TYPE_CHECKS = {
+    "string": (str, "a string"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean"),
+    "array": (list, "an array"),
+    "object": (dict, "an object"),
+}
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Turn an input schema into a function returning an error message or None"""
+    required = tuple(schema.get("required", ()))
+    checks = {}
+    for field, spec in schema.get("properties", {}).items():
+        check = _TYPE_CHECKS.get(spec.get("type"))
+        if check:
+            checks[field] = (check[0], f"Field '{field}' must be {check[1]}")
+    
+    def validate(arguments: Dict[str, Any]) -> Optional[str]:
+        for field in required:
+            if field not in arguments:
+                return f"Missing required field: {field}"
+        for field, value in arguments.items():
+            check = checks.get(field)
+            if check is not None and not isinstance(value, check[0]):
+                return check[1]
+        return None
+    
+    return validate
 
 
 class BaseTool(ABC):
-    """Abstract base class for all MCP tools"""
+    """
+    Abstract base class for all MCP tools
+    
+    Tools supply name, description, category and input_schema as plain class
+    attributes, so reading them is a dict lookup rather than a property call
+    that rebuilds the value. The input_schema dict is shared; do not mutate it.
+    """
 
     def __init__(self, session_manager=None):
         """Initialize tool with session manager (injected by ToolRegistry)"""
@@ -70,6 +114,9 @@ class BaseTool(ABC):
         """
         Execute the tool with given arguments
         
+        May be declared ``async def`` for tools that wait on I/O; the
+        registry awaits coroutine results.
+        
         Args:
             arguments: Tool-specific arguments
             
@@ -78,6 +125,11 @@ class BaseTool(ABC):
         """
         pass
     
+    @functools.cached_property
+    def _validator(self) -> Callable[[Dict[str, Any]], Optional[str]]:
+        """Validator compiled from input_schema on first use"""
+        return _compile_validator(self.input_schema)
+    
     def validate_arguments(self, arguments: Dict[str, Any]) -> Optional[str]:
         """
         Validate arguments against schema
@@ -85,36 +137,17 @@ class BaseTool(ABC):
         Returns:
             Error message if validation fails, None if valid
         """
-        required = self.input_schema.get("required", [])
-        properties = self.input_schema.get("properties", {})
-        
-        # Check required fields
-        for field in required:
-            if field not in arguments:
-                return f"Missing required field: {field}"
-        
-        # Check field types (basic validation)
-        for field, value in arguments.items():
-            if field in properties:
-                expected_type = properties[field].get("type")
-                if expected_type:
-                    if expected_type == "string" and not isinstance(value, str):
-                        return f"Field '{field}' must be a string"
-                    elif expected_type == "number" and not isinstance(value, (int, float)):
-                        return f"Field '{field}' must be a number"
-                    elif expected_type == "boolean" and not isinstance(value, bool):
-                        return f"Field '{field}' must be a boolean"
-                    elif expected_type == "array" and not isinstance(value, list):
-                        return f"Field '{field}' must be an array"
-                    elif expected_type == "object" and not isinstance(value, dict):
-                        return f"Field '{field}' must be an object"
-        
-        return None
+        return self._validator(arguments)
     
-    def to_mcp_definition(self) -> Dict[str, Any]:
-        """Convert to MCP tool definition"""
+    @functools.cached_property
+    def mcp_definition(self) -> Dict[str, Any]:
+        """MCP tool definition, built once per tool instance (do not mutate)"""
         return {
             "name": self.name,
             "description": self.description,
             "inputSchema": self.input_schema
-        }
\ No newline at end of file
+        }
+    
+    def to_mcp_definition(self) -> Dict[str, Any]:
+        """Convert to MCP tool definition"""
+        return self.mcp_definition
\ No newline at end of file
@@ -3,20 +3,70 @@ Configuration management for PTY MCP Server
 """
 
 import os
-import json
-from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Dict, Optional, Any
+import functools
+from types import MappingProxyType
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Mapping, Optional, Any, Tuple
+
+from pty_mcp_server.lib import fastjson
+from pty_mcp_server.lib.fsutil import atomic_write
+
+
+def _read_bytes(path: str, size: int) -> bytes:
+    """Read a file of known size through one descriptor, bypassing text-mode decoding"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+        # The file may have grown since it was stat'ed
+        while len(data) == size:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data += chunk
+            size = len(data)
+        return data
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a JSON file, memoized on (path, mtime, size) so unchanged files are served from memory"""
+    # Read-only view: the cached object is shared between callers
+    return MappingProxyType(fastjson.loads(_read_bytes(path, size)))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a small text file, memoized on (path, mtime, size)"""
+    return _read_bytes(path, size).decode('utf-8').strip()
+
+
+@functools.lru_cache(maxsize=4)
+def _prepare_paths(base_dir: str) -> Tuple[str, str]:
+    """Create the data directories once per base_dir; return (config_path, state_path)"""
+    config_dir = os.path.join(base_dir, 'config')
+    os.makedirs(config_dir, exist_ok=True)
+    return (os.path.join(config_dir, 'projects.json'),
+            os.path.join(base_dir, '.active_project'))
+
 
 @dataclass
 class ProjectConfig:
     """Configuration for PTY MCP projects"""
     base_dir: str
     config_path: str
+    # Legacy active-project file, read only when config_path has no 'active' entry
     state_path: str
     projects: Dict[str, str]
     default_project: Optional[str] = None
     active_project: Optional[str] = None
+    # Construct the PTY session in the background at startup (not persisted)
+    optimistic_session_warmup: bool = False
+    # Set once save() has created the parent directories
+    _dirs_ready: bool = field(default=False, init=False, repr=False, compare=False)
+    # (serialized bytes, file mtime_ns) of the last write, to skip identical saves
+    _last_saved: Optional[Tuple[bytes, int]] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_environment(cls) -> 'ProjectConfig':
@@ -27,56 +77,83 @@ class ProjectConfig:
         base_dir = os.environ.get('PTY_MCP_BASE_DIR', 
                                   os.path.join(xdg_data_home, 'pty-mcp'))
         
-        # Ensure directories exist
-        Path(base_dir).mkdir(parents=True, exist_ok=True)
-        config_dir = Path(base_dir) / 'config'
-        config_dir.mkdir(exist_ok=True)
+        # Ensure directories exist (only stats the tree on first use)
+        config_path, state_path = _prepare_paths(base_dir)
+        
+        warmup = os.environ.get('PTY_MCP_WARMUP', '').lower() in ('1', 'true', 'yes')
         
         return cls(
             base_dir=base_dir,
-            config_path=os.path.join(config_dir, 'projects.json'),
-            state_path=os.path.join(base_dir, '.active_project'),
+            config_path=config_path,
+            state_path=state_path,
             projects={},
             default_project=None,
-            active_project=None
+            active_project=None,
+            optimistic_session_warmup=warmup
         )
 
     def load(self) -> None:
-        """Load configuration from file"""
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    self.projects = data.get('projects', {})
-                    self.default_project = data.get('default')
-            except (json.JSONDecodeError, IOError):
-                # If config is corrupt, start fresh
-                self.projects = {}
-                self.default_project = None
+        """Load configuration and active project from a single file"""
+        data: Mapping[str, Any] = {}
+        try:
+            st = os.stat(self.config_path)
+            data = _load_json_cached(self.config_path, st.st_mtime_ns, st.st_size)
+            # Copy so callers never mutate the cached mapping
+            self.projects = dict(data.get('projects', {}))
+            self.default_project = data.get('default')
+        except FileNotFoundError:
+            # No config yet - keep defaults
+            pass
+        except (ValueError, OSError):
+            # If config is corrupt (bad JSON or encoding), start fresh
+            self.projects = {}
+            self.default_project = None
         
-        # Load active project state
-        if os.path.exists(self.state_path):
-            try:
-                with open(self.state_path, 'r') as f:
-                    self.active_project = f.read().strip()
-            except IOError:
-                self.active_project = None
+        if 'active' in data:
+            self.active_project = data['active']
+            return
+        
+        # Older versions kept the active project in a separate state file
+        try:
+            st = os.stat(self.state_path)
+            self.active_project = _read_text_cached(self.state_path, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError):
+            self.active_project = None
 
     def save(self) -> None:
-        """Save configuration to file"""
+        """Save configuration and active project in one atomic write"""
         config_data = {
             'projects': self.projects,
-            'default': self.default_project
+            'default': self.default_project,
+            'active': self.active_project
         }
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+        data = fastjson.dumps_bytes(config_data, indent=True)
+        
+        # Nothing to do if we already wrote exactly this and nobody touched the file since
+        if self._last_saved is not None and self._last_saved[0] == data:
+            try:
+                if os.stat(self.config_path).st_mtime_ns == self._last_saved[1]:
+                    return
+            except OSError:
+                pass
+        
+        # Ensure directory exists (first save only)
+        if not self._dirs_ready:
+            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            self._dirs_ready = True
+        
+        atomic_write(self.config_path, data)
+        self._last_saved = (data, os.stat(self.config_path).st_mtime_ns)
         
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        # The active project now lives in config_path; retire the legacy state file
+        try:
+            os.unlink(self.state_path)
+        except FileNotFoundError:
+            pass
         
-        # Save active project state
-        if self.active_project:
-            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
-            with open(self.state_path, 'w') as f:
-                f.write(self.active_project)
+        # mtime granularity can be coarse; never serve a pre-save parse
+        _load_json_cached.cache_clear()
+        _read_text_cached.cache_clear()
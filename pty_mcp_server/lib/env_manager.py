@@ -3,19 +3,26 @@ Project Environment Manager - Handles project-specific environment loading
 """
 
 import os
-import json
-from pathlib import Path
-from typing import Dict, Optional, Any
+import re
+import sys
+from functools import cached_property
+from typing import Dict, Optional, Any, Tuple
+
+# Values shorter than this are interned; common values ("true", shared paths)
+# repeat across projects, but long secrets should not bloat the intern table
+_INTERN_MAX_LEN = 64
+
+# KEY=VALUE line; value may be wrapped in double or single quotes
+_ENV_LINE = re.compile(
+    r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|(.*?))\s*$'
+)
 
 
 class ProjectEnvironmentManager:
     """Manages project-specific environment variables for exec commands"""
     
     def __init__(self):
-        """Initialize with base environment"""
-        # Store the base environment from when the server started
-        self.base_env = os.environ.copy()
-        
+        """Initialize manager; the base environment is captured on first use"""
         # Project-specific environments
         self.project_envs: Dict[str, Dict[str, str]] = {}
         
@@ -24,6 +31,20 @@ class ProjectEnvironmentManager:
         
         # Project configurations
         self.project_configs: Dict[str, Any] = {}
+        
+        # .env mtime_ns (None when absent) as of each project's last load
+        self._env_mtimes: Dict[str, Optional[int]] = {}
+        
+        # Bumped whenever the active project's overrides change
+        self.version = 0
+        
+        # (version, base + active project environment) from the last merge
+        self._merged_cache: Optional[Tuple[int, Dict[str, str]]] = None
+    
+    @cached_property
+    def base_env(self) -> Dict[str, str]:
+        """Snapshot of os.environ, taken the first time it is needed"""
+        return os.environ.copy()
     
     def load_project_env(self, project_name: str, project_path: str) -> Dict[str, Any]:
         """
@@ -37,29 +58,34 @@ class ProjectEnvironmentManager:
             Status information about the load operation
         """
         env_loaded = {}
-        env_file_path = Path(project_path) / ".env"
-        
-        # Try to load .env file if it exists
-        if env_file_path.exists():
-            try:
-                with open(env_file_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip empty lines and comments
-                        if line and not line.startswith('#'):
-                            # Parse KEY=VALUE format
-                            if '=' in line:
-                                key, value = line.split('=', 1)
-                                key = key.strip()
-                                # Remove quotes if present
-                                value = value.strip().strip('"').strip("'")
-                                env_loaded[key] = value
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": f"Failed to load .env: {str(e)}",
-                    "env_count": 0
-                }
+        env_file_path = os.path.join(project_path, ".env")
+        
+        # Try to load .env file; a missing file is not an error
+        try:
+            with open(env_file_path, 'r') as f:
+                text = f.read()
+                env_mtime = os.fstat(f.fileno()).st_mtime_ns
+            env_file_found = True
+            for line in text.splitlines():
+                # Skip empty lines and comments
+                if not line or line[0] == '#':
+                    continue
+                # Parse KEY=VALUE format, removing quotes if present
+                m = _ENV_LINE.match(line)
+                if m:
+                    value = m.group(2) or m.group(3) or m.group(4) or ''
+                    if len(value) < _INTERN_MAX_LEN:
+                        value = sys.intern(value)
+                    env_loaded[sys.intern(m.group(1))] = value
+        except (FileNotFoundError, IsADirectoryError):
+            env_file_found = False
+            env_mtime = None
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to load .env: {str(e)}",
+                "env_count": 0
+            }
         
         # Add project identification variables
         env_loaded["PROJECT_NAME"] = project_name
@@ -67,41 +93,79 @@ class ProjectEnvironmentManager:
         
         # Store the loaded environment
         self.project_envs[project_name] = env_loaded
+        self._env_mtimes[project_name] = env_mtime
         self.active_project = project_name
+        self.version += 1
         
         # Store project config
         self.project_configs[project_name] = {
             "path": project_path,
-            "env_file": str(env_file_path),
+            "env_file": env_file_path,
             "env_count": len(env_loaded)
         }
         
         return {
             "success": True,
             "project": project_name,
-            "env_file_found": env_file_path.exists(),
+            "env_file_found": env_file_found,
             "env_count": len(env_loaded),
-            "env_file": str(env_file_path) if env_file_path.exists() else None
+            "env_file": env_file_path if env_file_found else None
         }
     
+    def has_overrides(self) -> bool:
+        """
+        Check whether the active project changes any base environment variable
+        
+        Every loaded project sets PROJECT_NAME and PROJECT_PATH, so with a
+        project active this is False only when the base environment already
+        has the same values (e.g. the server was started for that project).
+        When it is False, callers can let child processes inherit the
+        environment (env=None) instead of passing a merged copy.
+        """
+        if not self.active_project:
+            return False
+        base = self.base_env
+        return any(base.get(key) != value
+                   for key, value in self.project_envs.get(self.active_project, {}).items())
+    
     def get_merged_env(self) -> Dict[str, str]:
         """
         Get the merged environment (base + project-specific)
         This is used for exec commands
         
         Returns:
-            Merged environment dictionary
+            Merged environment dictionary (shared; do not mutate). The same
+            object is returned until version changes.
         """
-        # Start with base environment
-        merged = self.base_env.copy()
+        # Pick up edits to the active project's .env (bumps version on reload)
+        if self.active_project:
+            self._reload_if_changed(self.active_project)
         
-        # If we have an active project, merge its environment
+        cache = self._merged_cache
+        if cache is not None and cache[0] == self.version:
+            return cache[1]
+        
+        # If we have an active project, merge its environment over the base
         if self.active_project and self.active_project in self.project_envs:
-            project_env = self.project_envs[self.active_project]
-            merged.update(project_env)
+            merged = {**self.base_env, **self.project_envs[self.active_project]}
+        else:
+            merged = self.base_env.copy()
         
+        self._merged_cache = (self.version, merged)
         return merged
     
+    def _reload_if_changed(self, project_name: str) -> None:
+        """Reload a project's .env if it appeared, vanished or was modified since loading"""
+        config = self.project_configs.get(project_name)
+        if not config:
+            return
+        try:
+            mtime = os.stat(config["env_file"]).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._env_mtimes.get(project_name):
+            self.load_project_env(project_name, config["path"])
+    
     def get_project_env(self, project_name: Optional[str] = None) -> Dict[str, str]:
         """
         Get environment variables for a specific project
@@ -127,14 +191,13 @@ class ProjectEnvironmentManager:
         Args:
             project_name: Name of project to clear
         """
-        if project_name in self.project_envs:
-            del self.project_envs[project_name]
-        
-        if project_name in self.project_configs:
-            del self.project_configs[project_name]
+        self.project_envs.pop(project_name, None)
+        self.project_configs.pop(project_name, None)
+        self._env_mtimes.pop(project_name, None)
         
         if self.active_project == project_name:
             self.active_project = None
+            self.version += 1
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -146,7 +209,8 @@ class ProjectEnvironmentManager:
         return {
             "active_project": self.active_project,
             "loaded_projects": list(self.project_envs.keys()),
-            "base_env_count": len(self.base_env),
+            # Don't force the snapshot just to report its size
+            "base_env_count": len(self.__dict__.get("base_env", os.environ)),
             "active_env_count": len(self.get_project_env()) if self.active_project else 0,
             "configs": self.project_configs
         }
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+JSON helpers - use orjson when it is installed, stdlib json otherwise
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, ready to write to a binary file"""
+    if orjson is not None:
+        try:
+            # orjson produces bytes natively; skip the str round trip
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, optionally indented by two spaces"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            # Types orjson rejects (non-str keys, big ints) - let stdlib decide
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
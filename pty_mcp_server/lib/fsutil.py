@@ -0,0 +1,20 @@
+"""
+Filesystem helpers shared by the config store and the plugin registry
+"""
+
+import os
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write data via a temp file and os.replace so readers never see a partial file"""
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -3,21 +3,124 @@ Tool Registry for dynamic plugin management
 """
 
 import os
+import sys
+import ast
+import asyncio
 import importlib
 import inspect
-from typing import Dict, List, Optional, Type
-from pathlib import Path
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
+from pty_mcp_server.lib import fastjson
 from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.fsutil import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Class attributes read from plugin source so tools can be listed unimported
+_STATIC_ATTRS = ("name", "description", "category", "input_schema")
+
+# Bump when the layout of the cached scan manifest changes
+_MANIFEST_VERSION = 1
+
+
+def default_manifest_path() -> str:
+    """Scan manifest location under the XDG cache directory"""
+    cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return os.path.join(cache_home, 'pty-mcp', 'plugins.json')
+
+
+def _import_plugin(import_path: str) -> Tuple[Optional[object], Optional[Exception]]:
+    """Import one plugin module; return (module, None) or (None, error)"""
+    try:
+        return importlib.import_module(import_path), None
+    except Exception as e:
+        return None, e
+
+
+def _is_tool_class(obj: object) -> bool:
+    """Whether obj is a concrete BaseTool subclass"""
+    return isinstance(obj, type) and obj is not BaseTool and issubclass(obj, BaseTool)
+
+
+def _tool_classes(module: object, module_name: str) -> List[Tuple[str, Type[BaseTool]]]:
+    """
+    Tool classes defined by an imported plugin module
+
+    Plugins name their class after the file (socket_open.py ->
+    SocketOpenTool), which is a single lookup; modules that do not follow
+    the convention get a scan of their namespace.
+    """
+    class_name = "".join(part.capitalize() for part in module_name.split("_")) + "Tool"
+    obj = getattr(module, class_name, None)
+    if _is_tool_class(obj):
+        return [(class_name, obj)]
+    return [(name, obj) for name, obj in vars(module).items() if _is_tool_class(obj)]
+
+
+def _scan_plugin(path: str) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Read a plugin's tool classes from its source without importing it
+
+    Returns:
+        [(class name, {attribute: value})] for each tool class, or None when
+        the module has to be imported instead: a class that does not derive
+        directly from BaseTool, or metadata that is not a plain literal
+    """
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    found = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if [getattr(base, "id", None) for base in node.bases] != ["BaseTool"]:
+            return None
+        attrs = {}
+        for stmt in node.body:
+            if (isinstance(stmt, ast.Assign)
+                    and len(stmt.targets) == 1
+                    and isinstance(stmt.targets[0], ast.Name)
+                    and stmt.targets[0].id in _STATIC_ATTRS):
+                try:
+                    attrs[stmt.targets[0].id] = ast.literal_eval(stmt.value)
+                except ValueError:
+                    return None
+        if len(attrs) != len(_STATIC_ATTRS):
+            return None
+        found.append((node.name, attrs))
+    return found
 
 
 class ToolRegistry:
     """Registry for dynamically loading and managing tool plugins"""
 
-    def __init__(self, session_manager=None):
-        """Initialize registry with session manager (injected into all tools)"""
+    def __init__(self, session_manager=None, manifest_path: Optional[str] = None):
+        """
+        Initialize registry with session manager (injected into all tools)
+        
+        Args:
+            session_manager: Passed to every tool instance
+            manifest_path: Cache of plugin source scans, reused across runs
+                (e.g. default_manifest_path()); no cache when None
+        """
+        self.manifest_path = manifest_path
+        # plugin path -> [mtime_ns, size, _scan_plugin result]; read on first use
+        self._scans: Optional[Dict[str, list]] = None
+        self._scans_dirty = False
         self._tools: Dict[str, BaseTool] = {}
-        self._categories: Dict[str, List[str]] = {}
+        # Tools known from their source but not imported yet:
+        # name -> (import path, class name); see get_tool
+        self._lazy: Dict[str, Tuple[str, str]] = {}
+        # MCP definition of every known tool, in registration order
+        self._definitions_by_name: Dict[str, Dict] = {}
+        self._categories: Dict[str, Set[str]] = {}
+        # list_tools() result; rebuilt after the next registration
+        self._definitions: Optional[List[Dict]] = None
         self.session_manager = session_manager
     
     def register(self, tool: BaseTool) -> None:
@@ -26,25 +129,100 @@ class ToolRegistry:
         
         Args:
             tool: Tool instance to register
+            
+        Raises:
+            ValueError: A tool with the same name is already registered
         """
-        self._tools[tool.name] = tool
+        # Interned keys let lookups with interned names match by identity
+        name = sys.intern(tool.name)
+        self._check_unique(name)
+        self._tools[name] = tool
+        self._definitions_by_name[name] = tool.mcp_definition
+        self._definitions = None
         
         # Track by category
-        category = tool.category
-        if category not in self._categories:
-            self._categories[category] = []
-        if tool.name not in self._categories[category]:
-            self._categories[category].append(tool.name)
+        self._categories.setdefault(tool.category, set()).add(name)
+    
+    def _check_unique(self, name: str) -> None:
+        """Refuse a second tool under an existing name, which would leave the
+        first one listed in its category"""
+        if name in self._definitions_by_name:
+            raise ValueError(f"Tool '{name}' is already registered")
+    
+    def _register_lazy(self, import_path: str, class_name: str, attrs: Dict[str, Any]) -> None:
+        """Register a tool from its source attributes; it is imported by get_tool"""
+        name = sys.intern(attrs["name"])
+        self._check_unique(name)
+        self._lazy[name] = (import_path, class_name)
+        self._definitions_by_name[name] = {
+            "name": name,
+            "description": attrs["description"],
+            "inputSchema": attrs["input_schema"]
+        }
+        self._definitions = None
+        self._categories.setdefault(attrs["category"], set()).add(name)
     
     def register_class(self, tool_class: Type[BaseTool]) -> None:
         """Register a tool class (instantiates with session manager)"""
         tool_instance = tool_class(self.session_manager)
         self.register(tool_instance)
     
+    def _read_manifest(self) -> Dict[str, list]:
+        """Cached scans from manifest_path; empty if disabled, missing, unreadable or outdated"""
+        if self.manifest_path is None:
+            return {}
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                data = fastjson.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _MANIFEST_VERSION:
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+    
+    def _save_manifest(self) -> None:
+        """Write back the scans if any plugin had to be re-read"""
+        if not self._scans_dirty or self.manifest_path is None:
+            return
+        try:
+            data = fastjson.dumps_bytes({'version': _MANIFEST_VERSION, 'files': self._scans})
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            atomic_write(self.manifest_path, data)
+        except (OSError, TypeError, ValueError):
+            # The cache is best-effort: an unwritable directory or a literal
+            # JSON cannot hold only costs the next start a rescan
+            logger.debug("Could not write plugin manifest %s", self.manifest_path,
+                         exc_info=True)
+            return
+        self._scans_dirty = False
+    
+    def _scan(self, path: str) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        """_scan_plugin, reusing the cached result while the file's mtime and size match"""
+        if self._scans is None:
+            self._scans = self._read_manifest()
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        entry = self._scans.get(path)
+        if (not isinstance(entry, list) or len(entry) != 3
+                or entry[0] != st.st_mtime_ns or entry[1] != st.st_size):
+            entry = [st.st_mtime_ns, st.st_size, _scan_plugin(path)]
+            self._scans[path] = entry
+            self._scans_dirty = True
+        return entry[2]
+    
     def load_from_directory(self, directory: str, category: str = None) -> int:
         """
         Load all tool plugins from a directory
         
+        Modules are imported under the pty_mcp_server.plugins package, so
+        directory must be one of its category folders. Tools whose metadata
+        can be read from source are listed without importing their module;
+        the import happens on first get_tool/execute.
+        
         Args:
             directory: Path to directory containing .py files
             category: Optional category filter
@@ -52,54 +230,76 @@ class ToolRegistry:
         Returns:
             Number of tools loaded
         """
+        loaded_count = self._load_directory(directory, category)
+        self._save_manifest()
+        return loaded_count
+    
+    def _load_directory(self, directory: str, category: Optional[str]) -> int:
+        """load_from_directory without writing the scan manifest"""
         loaded_count = 0
-        plugin_dir = Path(directory)
+        plugin_dir = os.path.normpath(directory)
+        plugin_dir_name = os.path.basename(plugin_dir)
         
-        if not plugin_dir.exists():
+        # Sorted so tools register in the same order on every platform;
+        # skip __init__.py, private and non-Python files
+        try:
+            with os.scandir(plugin_dir) as entries:
+                module_names = sorted(
+                    entry.name[:-3] for entry in entries
+                    if entry.name.endswith(".py")
+                    and not entry.name.startswith("_")
+                    and entry.is_file()
+                )
+        except OSError:
+            return 0
+        if not module_names:
             return 0
         
-        # Detect if we're running from a package
-        import sys
-        is_packaged = 'site-packages' in str(plugin_dir) or '.local' in str(plugin_dir)
-        
-        if not is_packaged:
-            # Running from source - add to path for relative imports
-            if str(plugin_dir.parent) not in sys.path:
-                sys.path.insert(0, str(plugin_dir.parent))
-                        
-        for py_file in plugin_dir.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue  # Skip __init__.py and private files
-            
-            module_name = py_file.stem
-            try:
-                # Import the module with correct path
-                if is_packaged:
-                    # Packaged version - use full module path
-                    import_path = f"pty_mcp_server.plugins.{plugin_dir.name}.{module_name}"
-                else:
-                    # Source version - use relative path
-                    import_path = f"{plugin_dir.name}.{module_name}"
-                
-                module = importlib.import_module(import_path)
-                
-                # Find all BaseTool subclasses
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) 
-                        and issubclass(obj, BaseTool) 
-                        and obj != BaseTool):
-                        
-                        # Instantiate and register
+        # Same dotted path whether installed or run from a checkout, so
+        # sys.path is never touched and each plugin is imported only once
+        import_paths = [f"pty_mcp_server.plugins.{plugin_dir_name}.{module_name}"
+                        for module_name in module_names]
+        
+        scanned = [self._scan(os.path.join(plugin_dir, module_name + ".py"))
+                   for module_name in module_names]
+        
+        # Modules that could not be read statically are imported now.
+        # Imports are mostly file I/O and unmarshalling; overlap them.
+        # Registration below stays on this thread, in module order.
+        eager_paths = [import_path for import_path, specs in zip(import_paths, scanned)
+                       if specs is None]
+        imported = {}
+        if eager_paths:
+            workers = min(len(eager_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                imported = dict(zip(eager_paths, pool.map(_import_plugin, eager_paths)))
+        
+        for module_name, import_path, specs in zip(module_names, import_paths, scanned):
+            if specs is not None:
+                for class_name, attrs in specs:
+                    if category is None or attrs["category"] == category:
                         try:
-                            tool = obj(self.session_manager)
-                            if category is None or tool.category == category:
-                                self.register(tool)
-                                loaded_count += 1
-                        except Exception as e:
-                            print(f"Error loading tool {name}: {e}")
+                            self._register_lazy(import_path, class_name, attrs)
+                            loaded_count += 1
+                        except ValueError:
+                            logger.exception("Error loading tool %s", class_name)
+                continue
+            
+            module, error = imported[import_path]
+            if error is not None:
+                logger.error("Error loading module %s from %s", module_name, import_path,
+                             exc_info=error)
+                continue
             
-            except Exception as e:
-                print(f"Error loading module {module_name} from {import_path}: {e}")
+            for name, obj in _tool_classes(module, module_name):
+                # Instantiate and register
+                try:
+                    tool = obj(self.session_manager)
+                    if category is None or tool.category == category:
+                        self.register(tool)
+                        loaded_count += 1
+                except Exception:
+                    logger.exception("Error loading tool %s", name)
         
         return loaded_count
     
@@ -114,78 +314,156 @@ class ToolRegistry:
             Dictionary of category -> count of tools loaded
         """
         counts = {}
-        plugins_dir = Path(base_dir) / "plugins"
+        plugins_dir = os.path.join(base_dir, "plugins")
+        
+        # d_type from the directory listing answers is_dir() without a stat;
+        # "_"-prefixed entries (__pycache__) are not categories
+        with os.scandir(plugins_dir) as entries:
+            category_dirs = sorted(
+                (entry.name, entry.path) for entry in entries
+                if not entry.name.startswith("_") and entry.is_dir()
+            )
         
-        for category_dir in plugins_dir.iterdir():
-            if category_dir.is_dir():
-                category = category_dir.name
-                count = self.load_from_directory(str(category_dir), category)
-                counts[category] = count
+        for category, category_dir in category_dirs:
+            counts[category] = self._load_directory(category_dir, category)
+        self._save_manifest()
         
         return counts
     
     def get_tool(self, name: str) -> Optional[BaseTool]:
-        """Get a tool by name"""
-        return self._tools.get(name)
+        """Get a tool by name, importing its plugin on first use"""
+        tool = self._tools.get(name)
+        if tool is None and name in self._lazy:
+            tool = self._import_tool(name)
+        return tool
+    
+    def _import_tool(self, name: str) -> Optional[BaseTool]:
+        """Import and instantiate a lazily registered tool"""
+        import_path, class_name = self._lazy[name]
+        try:
+            module = importlib.import_module(import_path)
+            tool = getattr(module, class_name)(self.session_manager)
+        except Exception:
+            logger.exception("Error loading tool %s from %s", name, import_path)
+            return None
+        
+        # The listed definition was read from the same literals; keep it
+        del self._lazy[name]
+        self._tools[name] = tool
+        return tool
     
     def list_tools(self) -> List[Dict]:
-        """List all registered tools in MCP format"""
-        return [tool.to_mcp_definition() for tool in self._tools.values()]
+        """List all registered tools in MCP format (shared list; do not mutate)"""
+        if self._definitions is None:
+            self._definitions = list(self._definitions_by_name.values())
+        return self._definitions
     
     def list_by_category(self, category: str) -> List[str]:
-        """List tool names in a specific category"""
-        return self._categories.get(category, [])
+        """List tool names in a specific category, sorted"""
+        return sorted(self._categories.get(category, ()))
     
     def get_categories(self) -> List[str]:
         """Get all categories"""
         return list(self._categories.keys())
     
-    def execute(self, tool_name: str, arguments: Dict) -> Dict:
+    def _check_call(self, tool_name: str, arguments: Dict):
+        """Resolve and validate a call; return (tool, None) or (None, failed ToolResult)"""
+        tool = self.get_tool(tool_name)
+        if not tool:
+            return None, ToolResult(
+                success=False,
+                content="",
+                error=f"Tool '{tool_name}' not found"
+            )
+        
+        # Validate arguments
+        error = tool.validate_arguments(arguments)
+        if error:
+            return None, ToolResult(
+                success=False,
+                content="",
+                error=f"Invalid arguments: {error}"
+            )
+        
+        return tool, None
+    
+    def execute_tool(self, tool_name: str, arguments: Dict) -> ToolResult:
         """
         Execute a tool by name
         
+        Coroutine tools are run to completion on a fresh event loop; callers
+        already inside a loop should use execute_tool_async instead.
+        
         Args:
             tool_name: Name of the tool to execute
             arguments: Arguments to pass to the tool
             
         Returns:
-            MCP-formatted response
+            The tool's ToolResult; lookup, validation and execution
+            failures are returned as unsuccessful results
         """
-        tool = self.get_tool(tool_name)
-        if not tool:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Tool '{tool_name}' not found"
-                }]
-            }
+        tool, failure = self._check_call(tool_name, arguments)
+        if failure:
+            return failure
         
-        # Validate arguments
-        error = tool.validate_arguments(arguments)
-        if error:
-            return {
-                "content": [{
-                    "type": "text", 
-                    "text": f"Invalid arguments: {error}"
-                }]
-            }
+        # Execute tool
+        try:
+            result = tool.execute(arguments)
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+            return result
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Error executing tool: {str(e)}"
+            )
+    
+    async def execute_tool_async(self, tool_name: str, arguments: Dict) -> ToolResult:
+        """
+        Execute a tool by name from within a running event loop
+        
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Arguments to pass to the tool
+            
+        Returns:
+            Same as execute_tool; coroutine tools are awaited
+        """
+        tool, failure = self._check_call(tool_name, arguments)
+        if failure:
+            return failure
         
         # Execute tool
         try:
             result = tool.execute(arguments)
-            return result.to_mcp_response()
+            if inspect.isawaitable(result):
+                result = await result
+            return result
         except Exception as e:
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Error executing tool: {str(e)}"
-                }]
-            }
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Error executing tool: {str(e)}"
+            )
+    
+    def execute(self, tool_name: str, arguments: Dict) -> Dict:
+        """
+        Execute a tool by name
+        
+        Args:
+            tool_name: Name of the tool to execute
+            arguments: Arguments to pass to the tool
+            
+        Returns:
+            MCP-formatted response
+        """
+        return self.execute_tool(tool_name, arguments).to_mcp_response()
     
     def __len__(self) -> int:
         """Get count of registered tools"""
-        return len(self._tools)
+        return len(self._definitions_by_name)
     
     def __contains__(self, tool_name: str) -> bool:
         """Check if a tool is registered"""
-        return tool_name in self._tools
\ No newline at end of file
+        return tool_name in self._definitions_by_name
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""
+Async subprocess helpers for running local and SSH commands
+
+Commands run under asyncio so a slow or hung process never blocks the event
+loop, and every call has a mandatory timeout after which the process is
+killed and reaped.
+"""
+
+import os
+import stat
+import asyncio
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# ssh reserves this exit status for its own failures (connect, auth, config)
+SSH_ERROR_STATUS = 255
+
+# OpenSSH ControlMaster sockets live in a private per-user directory as
+# %C, ssh's hash of (local host, remote host, port, user), which keeps the
+# socket path short
+SSH_CONTROL_PERSIST = "60s"
+
+_control_dir_lock = threading.Lock()
+# Verified socket directory; "" once it was found unsafe, None until checked
+_control_dir: Optional[str] = None
+
+
+class RemoteError(Exception):
+    """Base class for command execution failures"""
+
+
+class RemoteTimeout(RemoteError):
+    """The command did not finish in time and was killed"""
+
+
+class RemoteConnectionError(RemoteError):
+    """ssh could not establish a connection to the host"""
+
+
+class RemoteAuthError(RemoteError):
+    """ssh connected but the host rejected authentication"""
+
+
+@dataclass
+class RemoteResult:
+    """Finished command, shaped like subprocess.CompletedProcess"""
+    args: List[str]
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a process and wait for it so it does not linger as a zombie"""
+    try:
+        proc.kill()
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+async def run(cmd: Sequence[str], *, timeout: float,
+              cwd: Optional[str] = None,
+              env: Optional[Dict[str, str]] = None) -> RemoteResult:
+    """
+    Run a command without a shell and capture its output
+
+    Args:
+        cmd: Program and arguments
+        timeout: Seconds to wait before killing the process
+        cwd: Working directory for the process
+        env: Environment for the process (inherited when None)
+
+    Returns:
+        RemoteResult with decoded stdout/stderr
+
+    Raises:
+        RemoteTimeout: The process ran longer than timeout
+    """
+    args = list(cmd)
+    # stdin is the MCP transport; never let a child read from it
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        raise RemoteTimeout(f"Command timed out after {timeout} seconds")
+    except asyncio.CancelledError:
+        await _kill(proc)
+        raise
+
+    return RemoteResult(
+        args=args,
+        returncode=proc.returncode,
+        stdout=stdout.decode('utf-8', errors='replace'),
+        stderr=stderr.decode('utf-8', errors='replace')
+    )
+
+
+async def ssh(host: str, command: str, *, timeout: float,
+              options: Sequence[str] = ()) -> RemoteResult:
+    """
+    Run a command on a remote host through the ssh client
+
+    Args:
+        host: SSH destination (user@host or host)
+        command: Remote command line
+        timeout: Seconds to wait before killing ssh
+        options: Extra ssh arguments placed before the host
+
+    Returns:
+        RemoteResult; a non-zero returncode is the remote command's status
+
+    Raises:
+        RemoteTimeout: ssh ran longer than timeout
+        RemoteAuthError: The host rejected authentication
+        RemoteConnectionError: ssh failed before running the command
+    """
+    result = await run(["ssh", *options, host, command], timeout=timeout)
+
+    if result.returncode == SSH_ERROR_STATUS:
+        message = result.stderr.strip() or f"ssh exited with status {SSH_ERROR_STATUS}"
+        if "Permission denied" in result.stderr or "Authentication failed" in result.stderr:
+            raise RemoteAuthError(message)
+        raise RemoteConnectionError(message)
+
+    return result
+
+
+def _private_dir(path: str) -> bool:
+    """
+    Create path as a 0700 directory, or accept it only if it already is one
+
+    Another local user could have created the path first (or put a symlink
+    there) to plant a fake master socket, so ownership and mode are checked
+    with lstat rather than trusted.
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(st.st_mode)
+            and st.st_uid == os.getuid()
+            and st.st_mode & 0o077 == 0)
+
+
+def ssh_control_dir() -> Optional[str]:
+    """
+    Directory for ControlMaster sockets, or None if no safe one is available
+
+    Uses $XDG_RUNTIME_DIR (private to the user) when set, otherwise a
+    directory in the temp dir keyed by UID. Resolved once per process.
+    """
+    global _control_dir
+    if _control_dir is None:
+        with _control_dir_lock:
+            if _control_dir is None:
+                runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+                if runtime_dir:
+                    path = os.path.join(runtime_dir, "ptymcp-ssh")
+                else:
+                    path = os.path.join(tempfile.gettempdir(), f"ptymcp-ssh-{os.getuid()}")
+                _control_dir = path if _private_dir(path) else ""
+    return _control_dir or None
+
+
+def ssh_control_options() -> Tuple[str, ...]:
+    """
+    ssh options that share one multiplexed connection per destination
+
+    The first command to a host opens a master connection that lingers for
+    SSH_CONTROL_PERSIST; later commands reuse it and skip the TCP and key
+    exchange handshake. Empty (no sharing) when ssh_control_dir() is None.
+    """
+    control_dir = ssh_control_dir()
+    if control_dir is None:
+        return ()
+    return (
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={os.path.join(control_dir, '%C')}",
+        "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+    )
+
+
+async def ssh_close(host: str, *, timeout: float,
+                    options: Sequence[str] = ()) -> RemoteResult:
+    """
+    Ask the ControlMaster connection for a destination to exit
+
+    Args:
+        host: SSH destination as passed to ssh()
+        timeout: Seconds to wait for ssh
+        options: Extra ssh arguments that select the destination (e.g. -p)
+
+    Returns:
+        RemoteResult; returncode is non-zero when no master was running
+    """
+    control_dir = ssh_control_dir()
+    if control_dir is None:
+        # Connection sharing is off, so no master can be running
+        return RemoteResult(args=[], returncode=1, stdout="",
+                            stderr="SSH connection sharing is disabled")
+    return await run(
+        ["ssh", "-O", "exit", "-o", f"ControlPath={os.path.join(control_dir, '%C')}",
+         *options, host],
+        timeout=timeout
+    )
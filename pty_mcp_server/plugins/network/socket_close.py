@@ -4,39 +4,25 @@ Socket Close tool - Close active socket
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SocketCloseTool(BaseTool):
     """Close the active socket connection"""
     
-    @property
-    def name(self) -> str:
-        return "socket-close"
+    name = "socket-close"
+    description = "Close the active socket connection"
+    category = "network"
     
-    @property
-    def description(self) -> str:
-        return "Close the active socket connection"
-    
-    @property
-    def category(self) -> str:
-        return "network"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Close the socket"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         socket_session = self.session_manager.get_socket_session()
         
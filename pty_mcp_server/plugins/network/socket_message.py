@@ -3,58 +3,43 @@ Socket Message tool - Send message and wait for prompt
 """
 
 from typing import Dict, Any
-import time
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SocketMessageTool(BaseTool):
     """Send message through socket and wait for prompt/response"""
     
-    @property
-    def name(self) -> str:
-        return "socket-message"
+    name = "socket-message"
+    description = "Send message through socket and wait for prompt/response"
+    category = "network"
     
-    @property
-    def description(self) -> str:
-        return "Send message through socket and wait for prompt/response"
-    
-    @property
-    def category(self) -> str:
-        return "network"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "Message to send through the socket"
-                },
-                "wait_for_prompt": {
-                    "type": "boolean",
-                    "description": "Whether to wait for a prompt after sending (default: true)"
-                },
-                "prompt_timeout": {
-                    "type": "number",
-                    "description": "Timeout in seconds for waiting for prompt (default: 5)"
-                },
-                "add_newline": {
-                    "type": "boolean",
-                    "description": "Add newline after message (default: true)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "Message to send through the socket"
+            },
+            "wait_for_prompt": {
+                "type": "boolean",
+                "description": "Whether to wait for a prompt after sending (default: true)"
             },
-            "required": ["message"]
-        }
+            "prompt_timeout": {
+                "type": "number",
+                "description": "Timeout in seconds for waiting for prompt (default: 5)"
+            },
+            "add_newline": {
+                "type": "boolean",
+                "description": "Add newline after message (default: true)"
+            }
+        },
+        "required": ["message"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Send message and optionally wait for prompt"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         socket_session = self.session_manager.get_socket_session()
         
@@ -83,11 +68,8 @@ class SocketMessageTool(BaseTool):
             
             # Wait for prompt/response if requested
             if wait_for_prompt:
-                # Small delay to allow server to process
-                time.sleep(0.1)
-                
-                # Read response with timeout
-                received = socket_session.read(prompt_timeout)
+                # Returns once the reply stops arriving, not after a fixed delay
+                received = socket_session.read_until_quiet(prompt_timeout)
                 
                 if received and received != "(no data received within timeout)":
                     response += f"\n\nReceived:\n{received}"
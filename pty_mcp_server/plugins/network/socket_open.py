@@ -4,53 +4,39 @@ Socket Open tool - Open a network socket
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SocketOpenTool(BaseTool):
     """Open a TCP or UDP socket connection"""
     
-    @property
-    def name(self) -> str:
-        return "socket-open"
+    name = "socket-open"
+    description = "Open a TCP or UDP socket connection"
+    category = "network"
     
-    @property
-    def description(self) -> str:
-        return "Open a TCP or UDP socket connection"
-    
-    @property
-    def category(self) -> str:
-        return "network"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "description": "Host to connect to"
-                },
-                "port": {
-                    "type": "number",
-                    "description": "Port number"
-                },
-                "protocol": {
-                    "type": "string",
-                    "enum": ["tcp", "udp"],
-                    "description": "Protocol (tcp or udp)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "Host to connect to"
             },
-            "required": ["host", "port"]
-        }
+            "port": {
+                "type": "number",
+                "description": "Port number"
+            },
+            "protocol": {
+                "type": "string",
+                "enum": ["tcp", "udp"],
+                "description": "Protocol (tcp or udp)"
+            }
+        },
+        "required": ["host", "port"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Open a socket connection"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         socket_session = self.session_manager.get_socket_session()
         
@@ -4,44 +4,30 @@ Socket Read tool - Read data from socket
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SocketReadTool(BaseTool):
     """Read data from active socket"""
     
-    @property
-    def name(self) -> str:
-        return "socket-read"
+    name = "socket-read"
+    description = "Read data from the active socket"
+    category = "network"
     
-    @property
-    def description(self) -> str:
-        return "Read data from the active socket"
-    
-    @property
-    def category(self) -> str:
-        return "network"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "timeout": {
-                    "type": "number",
-                    "description": "Read timeout in seconds (default: 2.0)"
-                }
-            },
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "timeout": {
+                "type": "number",
+                "description": "Read timeout in seconds (default: 2.0)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Read from the socket"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         socket_session = self.session_manager.get_socket_session()
         
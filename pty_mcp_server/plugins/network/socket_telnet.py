@@ -3,11 +3,22 @@ Socket Telnet tool - Simple Telnet client with IAC handling
 """
 
 from typing import Dict, Any
+import re
 import socket
-import time
 
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
+# One IAC command: option negotiation (IAC WILL/WONT/DO/DONT opt), a whole
+# subnegotiation up to IAC SE, an escaped 255 (IAC IAC), or any other
+# two-byte command; a lone IAC at the end of the data matches too
+_IAC_RE = re.compile(rb'\xff(?:[\xfb-\xfe].?|\xfa.*?\xff\xf0|\xff|.?)', re.DOTALL)
+
+
+def _iac_replacement(match: re.Match) -> bytes:
+    """Escaped IAC IAC stands for a literal 255; every other command is dropped"""
+    return b'\xff' if match.group() == b'\xff\xff' else b''
+
+
 class SocketTelnetTool(BaseTool):
     """Simple Telnet-like communication with IAC sequence handling"""
     
@@ -20,123 +31,78 @@ class SocketTelnetTool(BaseTool):
     SB = 250    # Subnegotiation begin
     SE = 240    # Subnegotiation end
     
-    @property
-    def name(self) -> str:
-        return "socket-telnet"
+    name = "socket-telnet"
+    description = "Simple Telnet client over TCP sockets with IAC handling"
+    category = "network"
     
-    @property
-    def description(self) -> str:
-        return "Simple Telnet client over TCP sockets with IAC handling"
-    
-    @property
-    def category(self) -> str:
-        return "network"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "description": "Hostname or IP address to connect to"
-                },
-                "port": {
-                    "type": "number",
-                    "description": "Port number (default: 23 for telnet)"
-                },
-                "initial_read": {
-                    "type": "boolean",
-                    "description": "Read initial banner after connection (default: true)"
-                },
-                "timeout": {
-                    "type": "number",
-                    "description": "Connection timeout in seconds (default: 10)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "Hostname or IP address to connect to"
+            },
+            "port": {
+                "type": "number",
+                "description": "Port number (default: 23 for telnet)"
+            },
+            "initial_read": {
+                "type": "boolean",
+                "description": "Read initial banner after connection (default: true)"
             },
-            "required": ["host"]
-        }
+            "timeout": {
+                "type": "number",
+                "description": "Connection timeout in seconds (default: 10)"
+            }
+        },
+        "required": ["host"]
+    }
     
     def remove_iac_sequences(self, data: bytes) -> bytes:
         """Remove Telnet IAC sequences from data"""
-        result = bytearray()
-        i = 0
-        while i < len(data):
-            if data[i] == self.IAC:
-                # IAC found, skip the command sequence
-                if i + 1 < len(data):
-                    cmd = data[i + 1]
-                    if cmd in [self.DONT, self.DO, self.WONT, self.WILL]:
-                        # Skip IAC, command, and option
-                        i += 3
-                    elif cmd == self.SB:
-                        # Skip until SE (subnegotiation end)
-                        j = i + 2
-                        while j < len(data) - 1:
-                            if data[j] == self.IAC and data[j + 1] == self.SE:
-                                i = j + 2
-                                break
-                            j += 1
-                        else:
-                            i += 2  # Skip incomplete subnegotiation
-                    elif cmd == self.IAC:
-                        # Double IAC means literal 255
-                        result.append(255)
-                        i += 2
-                    else:
-                        # Other commands, skip 2 bytes
-                        i += 2
-                else:
-                    # Incomplete IAC at end
-                    i += 1
-            else:
-                # Normal data
-                result.append(data[i])
-                i += 1
-        
-        return bytes(result)
+        if b'\xff' not in data:
+            return data
+        return _IAC_RE.sub(_iac_replacement, data)
     
     def negotiate_telnet_options(self, sock: socket.socket) -> str:
         """Handle initial Telnet negotiation"""
         responses = []
-        sock.settimeout(0.5)  # Short timeout for negotiation
+        sock.settimeout(0.5)  # Wait this long for the server to open negotiation
         
         try:
             # Read and respond to initial negotiations
             for _ in range(5):  # Max 5 rounds of negotiation
                 try:
                     data = sock.recv(1024)
-                    if not data:
-                        break
-                    
-                    # Look for IAC sequences
-                    i = 0
-                    while i < len(data):
-                        if data[i] == self.IAC and i + 2 < len(data):
-                            cmd = data[i + 1]
-                            option = data[i + 2]
-                            
-                            # Respond to negotiations (refuse all for simplicity)
-                            if cmd == self.DO:
-                                # Server wants us to enable option, we refuse
-                                response = bytes([self.IAC, self.WONT, option])
-                                sock.send(response)
-                                responses.append(f"Refused DO {option}")
-                            elif cmd == self.WILL:
-                                # Server will enable option, we don't want it
-                                response = bytes([self.IAC, self.DONT, option])
-                                sock.send(response)
-                                responses.append(f"Refused WILL {option}")
-                            
-                            i += 3
-                        else:
-                            i += 1
-                    
-                    # Small delay before next read
-                    time.sleep(0.1)
-                    
                 except socket.timeout:
                     break
+                if not data:
+                    break
+                
+                # Refuse every option (for simplicity); one write per round
+                reply = bytearray()
+                i = data.find(b'\xff')
+                if i < 0:
+                    # Plain data, so the server has finished negotiating
+                    break
+                while 0 <= i < len(data) - 2:
+                    cmd = data[i + 1]
+                    option = data[i + 2]
+                    if cmd == self.DO:
+                        # Server wants us to enable option, we refuse
+                        reply += bytes((self.IAC, self.WONT, option))
+                        responses.append(f"Refused DO {option}")
+                    elif cmd == self.WILL:
+                        # Server will enable option, we don't want it
+                        reply += bytes((self.IAC, self.DONT, option))
+                        responses.append(f"Refused WILL {option}")
+                    i = data.find(b'\xff', i + 3)
+                if reply:
+                    sock.sendall(reply)
+                
+                # Replies to our refusals arrive within a round trip; stop as
+                # soon as the line goes quiet instead of sleeping between rounds
+                sock.settimeout(0.1)
                     
         except Exception as e:
             responses.append(f"Negotiation error: {e}")
@@ -4,44 +4,34 @@ Socket Write tool - Send data through socket
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
+
+# Request-line prefixes that mark data as an HTTP request
+HTTP_METHODS = ('GET ', 'POST ', 'PUT ', 'DELETE ', 'HEAD ', 'OPTIONS ', 'PATCH ', 'CONNECT ', 'TRACE ')
+
 
 class SocketWriteTool(BaseTool):
     """Send data through active socket"""
     
-    @property
-    def name(self) -> str:
-        return "socket-write"
-    
-    @property
-    def description(self) -> str:
-        return "Send data through the active socket"
-    
-    @property
-    def category(self) -> str:
-        return "network"
+    name = "socket-write"
+    description = "Send data through the active socket"
+    category = "network"
     
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "data": {
-                    "type": "string",
-                    "description": "Data to send through the socket"
-                }
-            },
-            "required": ["data"]
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "data": {
+                "type": "string",
+                "description": "Data to send through the socket"
+            }
+        },
+        "required": ["data"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Write to the socket"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         socket_session = self.session_manager.get_socket_session()
         
@@ -56,9 +46,8 @@ class SocketWriteTool(BaseTool):
         original_data = arguments.get("data", "")
         data = original_data
         
-        # Check if this looks like an HTTP request
-        http_methods = ('GET ', 'POST ', 'PUT ', 'DELETE ', 'HEAD ', 'OPTIONS ', 'PATCH ', 'CONNECT ', 'TRACE ')
-        is_http = any(data.startswith(method) for method in http_methods)
+        # Check if this looks like an HTTP request (one startswith over the tuple)
+        is_http = data.startswith(HTTP_METHODS)
         
         debug_info = []
         if is_http:
@@ -4,39 +4,25 @@ Process Kill tool - Terminate active process
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class KillProcTool(BaseTool):
     """Terminate active process"""
     
-    @property
-    def name(self) -> str:
-        return "kill-proc"
+    name = "kill-proc"
+    description = "Kill the active process"
+    category = "process"
     
-    @property
-    def description(self) -> str:
-        return "Kill the active process"
-    
-    @property
-    def category(self) -> str:
-        return "process"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Kill the process"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         proc_session = self.session_manager.get_proc_session()
         
@@ -5,39 +5,29 @@ Process CMD tool - Launch Windows Command Prompt
 from typing import Dict, Any
 import platform
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class ProcCmdTool(BaseTool):
     """Launch Windows Command Prompt (cmd.exe) as a subprocess"""
     
-    @property
-    def name(self) -> str:
-        return "proc-cmd"
+    name = "proc-cmd"
+    description = "Launch Windows Command Prompt (cmd.exe) as a subprocess"
+    category = "process"
     
-    @property
-    def description(self) -> str:
-        return "Launch Windows Command Prompt (cmd.exe) as a subprocess"
-    
-    @property
-    def category(self) -> str:
-        return "process"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "working_dir": {
-                    "type": "string",
-                    "description": "Working directory (optional)"
-                },
-                "keep_open": {
-                    "type": "boolean",
-                    "description": "Keep cmd.exe open after commands (default: true)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "working_dir": {
+                "type": "string",
+                "description": "Working directory (optional)"
             },
-            "required": []
-        }
+            "keep_open": {
+                "type": "boolean",
+                "description": "Keep cmd.exe open after commands (default: true)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Spawn Windows Command Prompt"""
@@ -49,11 +39,7 @@ class ProcCmdTool(BaseTool):
             )
         
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         proc_session = self.session_manager.get_process_session()
         
@@ -5,44 +5,34 @@ Process PowerShell tool - Launch Windows PowerShell
 from typing import Dict, Any
 import platform
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class ProcPsTool(BaseTool):
     """Launch Windows PowerShell as a subprocess"""
     
-    @property
-    def name(self) -> str:
-        return "proc-ps"
+    name = "proc-ps"
+    description = "Launch Windows PowerShell as a subprocess"
+    category = "process"
     
-    @property
-    def description(self) -> str:
-        return "Launch Windows PowerShell as a subprocess"
-    
-    @property
-    def category(self) -> str:
-        return "process"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "working_dir": {
-                    "type": "string",
-                    "description": "Working directory (optional)"
-                },
-                "no_exit": {
-                    "type": "boolean",
-                    "description": "Keep PowerShell open after commands (default: true)"
-                },
-                "execution_policy": {
-                    "type": "string",
-                    "enum": ["Restricted", "AllSigned", "RemoteSigned", "Unrestricted", "Bypass"],
-                    "description": "Execution policy for the session (default: RemoteSigned)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "working_dir": {
+                "type": "string",
+                "description": "Working directory (optional)"
             },
-            "required": []
-        }
+            "no_exit": {
+                "type": "boolean",
+                "description": "Keep PowerShell open after commands (default: true)"
+            },
+            "execution_policy": {
+                "type": "string",
+                "enum": ["Restricted", "AllSigned", "RemoteSigned", "Unrestricted", "Bypass"],
+                "description": "Execution policy for the session (default: RemoteSigned)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Spawn Windows PowerShell"""
@@ -54,11 +44,7 @@ class ProcPsTool(BaseTool):
             )
         
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         proc_session = self.session_manager.get_process_session()
         
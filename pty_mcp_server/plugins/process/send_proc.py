@@ -4,44 +4,30 @@ Process Send tool - Send input to active process
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SendProcTool(BaseTool):
     """Send input to active process"""
     
-    @property
-    def name(self) -> str:
-        return "send-proc"
+    name = "send-proc"
+    description = "Send input to the active process"
+    category = "process"
     
-    @property
-    def description(self) -> str:
-        return "Send input to the active process"
-    
-    @property
-    def category(self) -> str:
-        return "process"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "Text to send to process"
-                }
-            },
-            "required": ["message"]
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "Text to send to process"
+            }
+        },
+        "required": ["message"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Send input to process"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         proc_session = self.session_manager.get_proc_session()
         
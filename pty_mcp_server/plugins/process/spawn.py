@@ -4,59 +4,45 @@ Process Spawn tool - Start a process without PTY
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SpawnTool(BaseTool):
     """Start a process without PTY"""
     
-    @property
-    def name(self) -> str:
-        return "spawn"
+    name = "spawn"
+    description = "Launch a process without PTY"
+    category = "process"
     
-    @property
-    def description(self) -> str:
-        return "Launch a process without PTY"
-    
-    @property
-    def category(self) -> str:
-        return "process"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "Command to spawn"
-                },
-                "args": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Command arguments"
-                },
-                "working_dir": {
-                    "type": "string",
-                    "description": "Working directory"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": "Command to spawn"
             },
-            "required": ["command"]
-        }
+            "args": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Command arguments"
+            },
+            "working_dir": {
+                "type": "string",
+                "description": "Working directory"
+            }
+        },
+        "required": ["command"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start a process"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         proc_session = self.session_manager.get_proc_session()
         
         # Clean up any completed process
         if proc_session.process and proc_session.process.poll() is not None:
-            proc_session.process = None
+            proc_session.reap()
         
         # Check if already active
         if proc_session.is_active():
@@ -72,7 +58,7 @@ class SpawnTool(BaseTool):
         
         # Use active project directory if available
         if not working_dir and self.session_manager.active_project:
-            working_dir = self.session_manager.active_project.get("path")
+            working_dir = self.session_manager.active_project.path
         
         try:
             proc_session.start(command, args, working_dir)
@@ -84,7 +70,7 @@ class SpawnTool(BaseTool):
             if proc_session.process and proc_session.process.poll() is not None:
                 # Process completed, clean it up
                 return_code = proc_session.process.returncode
-                proc_session.process = None  # Clear the completed process
+                proc_session.reap()  # Close its pipes and clear the completed process
                 return ToolResult(
                     success=True,
                     content=f"Process completed: {command} (exit code: {return_code})\n{output}"
@@ -0,0 +1,66 @@
+"""
+SSH close tool - Tear down the shared SSH connection to a host
+"""
+
+from typing import Dict, Any
+
+from pty_mcp_server.lib import remote
+from pty_mcp_server.lib.base import BaseTool, ToolResult
+
+class SSHCloseTool(BaseTool):
+    """Close the multiplexed connection opened by ssh-proc"""
+    
+    name = "ssh-close"
+    description = "Close the persistent SSH connection that ssh-proc keeps open to a host"
+    category = "process"
+    
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "SSH host as given to ssh-proc (user@host or host)"
+            },
+            "port": {
+                "type": "number",
+                "description": "SSH port (default: 22)"
+            }
+        },
+        "required": ["host"]
+    }
+    
+    async def execute(self, arguments: Dict[str, Any]) -> ToolResult:
+        """Stop the ControlMaster for the host"""
+        host = arguments.get("host")
+        port = arguments.get("port", 22)
+        
+        ssh_opts = ("-p", str(int(port))) if port != 22 else ()
+        
+        try:
+            result = await remote.ssh_close(host, timeout=10, options=ssh_opts)
+            
+            if result.returncode == 0:
+                return ToolResult(
+                    success=True,
+                    content=f"Closed SSH connection to {host}",
+                    metadata={"host": host}
+                )
+            else:
+                return ToolResult(
+                    success=False,
+                    content="",
+                    error=f"No open SSH connection to {host}: {result.stderr.strip()}"
+                )
+                
+        except remote.RemoteTimeout:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"Timed out closing SSH connection to {host}"
+            )
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"SSH close failed: {str(e)}"
+            )
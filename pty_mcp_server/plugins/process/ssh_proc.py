@@ -3,59 +3,54 @@ SSH subprocess tool - Run SSH commands without PTY
 Useful for non-interactive SSH operations
 """
 
-import subprocess
-import json
 from typing import Dict, Any
-from pathlib import Path
-
 
+from pty_mcp_server.lib import remote
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
 class SSHProcTool(BaseTool):
     """SSH client as subprocess (non-PTY)"""
     
-    @property
-    def name(self) -> str:
-        return "ssh-proc"
-    
-    @property
-    def description(self) -> str:
-        return "Run SSH command as subprocess (non-interactive)"
+    name = "ssh-proc"
+    description = "Run SSH command as subprocess (non-interactive)"
+    category = "process"
     
-    @property
-    def category(self) -> str:
-        return "process"
+    # Options for non-interactive use, shared by every call
+    _BASE_OPTS = (
+        "-o", "StrictHostKeyChecking=no",
+        "-o", "UserKnownHostsFile=/dev/null",
+        "-o", "BatchMode=yes",
+        "-o", "ConnectTimeout=10"
+    )
     
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "description": "SSH host (user@host or host)"
-                },
-                "command": {
-                    "type": "string",
-                    "description": "Command to execute on remote host"
-                },
-                "port": {
-                    "type": "number",
-                    "description": "SSH port (default: 22)"
-                },
-                "key_file": {
-                    "type": "string",
-                    "description": "Path to SSH private key file (optional)"
-                },
-                "timeout": {
-                    "type": "number",
-                    "description": "Command timeout in seconds (default: 30)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "SSH host (user@host or host)"
+            },
+            "command": {
+                "type": "string",
+                "description": "Command to execute on remote host"
+            },
+            "port": {
+                "type": "number",
+                "description": "SSH port (default: 22)"
+            },
+            "key_file": {
+                "type": "string",
+                "description": "Path to SSH private key file (optional)"
             },
-            "required": ["host", "command"]
-        }
+            "timeout": {
+                "type": "number",
+                "description": "Command timeout in seconds (default: 30)"
+            }
+        },
+        "required": ["host", "command"]
+    }
     
-    def execute(self, arguments: Dict[str, Any]) -> ToolResult:
+    async def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Execute SSH command as subprocess"""
         host = arguments.get("host")
         command = arguments.get("command")
@@ -63,37 +58,18 @@ class SSHProcTool(BaseTool):
         key_file = arguments.get("key_file")
         timeout = arguments.get("timeout", 30)
         
-        # Build SSH command
-        ssh_cmd = ["ssh"]
-        
-        # Add port if not default
-        if port != 22:
-            ssh_cmd.extend(["-p", str(port)])
-        
-        # Add key file if specified
-        if key_file:
-            ssh_cmd.extend(["-i", key_file])
-        
-        # Add common options for non-interactive use
-        ssh_cmd.extend([
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "BatchMode=yes",
-            "-o", "ConnectTimeout=10"
-        ])
-        
-        # Add host and command
-        ssh_cmd.append(host)
-        ssh_cmd.append(command)
+        # Port if not default, key file if given, then the fixed options and
+        # connection reuse per host (closed by ssh-close)
+        ssh_opts = [
+            *(("-p", str(int(port))) if port != 22 else ()),
+            *(("-i", key_file) if key_file else ()),
+            *self._BASE_OPTS,
+            *remote.ssh_control_options()
+        ]
         
         try:
-            # Execute SSH command
-            result = subprocess.run(
-                ssh_cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            # Execute SSH command without blocking the event loop
+            result = await remote.ssh(host, command, timeout=timeout, options=ssh_opts)
             
             if result.returncode == 0:
                 return ToolResult(
@@ -112,12 +88,24 @@ class SSHProcTool(BaseTool):
                     error=f"SSH command failed: {result.stderr}"
                 )
                 
-        except subprocess.TimeoutExpired:
+        except remote.RemoteTimeout:
             return ToolResult(
                 success=False,
                 content="",
                 error=f"SSH command timed out after {timeout} seconds"
             )
+        except remote.RemoteAuthError as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"SSH authentication failed: {e}"
+            )
+        except remote.RemoteConnectionError as e:
+            return ToolResult(
+                success=False,
+                content="",
+                error=f"SSH connection failed: {e}"
+            )
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -4,39 +4,25 @@ Serial Close tool - Close the active serial connection
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SerialCloseTool(BaseTool):
     """Close the active serial connection"""
     
-    @property
-    def name(self) -> str:
-        return "serial-close"
+    name = "serial-close"
+    description = "Close the active serial connection"
+    category = "serial"
     
-    @property
-    def description(self) -> str:
-        return "Close the active serial connection"
-    
-    @property
-    def category(self) -> str:
-        return "serial"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Close the serial connection"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         serial_session = self.session_manager.get_serial_session()
         
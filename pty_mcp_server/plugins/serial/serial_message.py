@@ -5,56 +5,42 @@ Serial Message tool - Send message and wait for response
 from typing import Dict, Any
 import time
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SerialMessageTool(BaseTool):
     """Send message through serial and wait for prompt/response"""
     
-    @property
-    def name(self) -> str:
-        return "serial-message"
+    name = "serial-message"
+    description = "Send message through serial port and wait for response"
+    category = "serial"
     
-    @property
-    def description(self) -> str:
-        return "Send message through serial port and wait for response"
-    
-    @property
-    def category(self) -> str:
-        return "serial"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "Message to send through the serial port"
-                },
-                "wait_for_prompt": {
-                    "type": "boolean",
-                    "description": "Whether to wait for a response after sending (default: true)"
-                },
-                "prompt_timeout": {
-                    "type": "number",
-                    "description": "Timeout in seconds for waiting for response (default: 5)"
-                },
-                "add_newline": {
-                    "type": "boolean",
-                    "description": "Add newline (\\r\\n) after message (default: true)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "Message to send through the serial port"
+            },
+            "wait_for_prompt": {
+                "type": "boolean",
+                "description": "Whether to wait for a response after sending (default: true)"
+            },
+            "prompt_timeout": {
+                "type": "number",
+                "description": "Timeout in seconds for waiting for response (default: 5)"
             },
-            "required": ["message"]
-        }
+            "add_newline": {
+                "type": "boolean",
+                "description": "Add newline (\\r\\n) after message (default: true)"
+            }
+        },
+        "required": ["message"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Send message and optionally wait for response"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         serial_session = self.session_manager.get_serial_session()
         
@@ -4,63 +4,49 @@ Serial Open tool - Open a serial port connection
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SerialOpenTool(BaseTool):
     """Open a serial port connection"""
     
-    @property
-    def name(self) -> str:
-        return "serial-open"
+    name = "serial-open"
+    description = "Open a serial port connection to a device"
+    category = "serial"
     
-    @property
-    def description(self) -> str:
-        return "Open a serial port connection to a device"
-    
-    @property
-    def category(self) -> str:
-        return "serial"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "device": {
-                    "type": "string",
-                    "description": "Serial device path (e.g., /dev/ttyUSB0, COM3)"
-                },
-                "baudrate": {
-                    "type": "number",
-                    "description": "Baud rate (default: 9600)"
-                },
-                "bytesize": {
-                    "type": "number",
-                    "enum": [5, 6, 7, 8],
-                    "description": "Number of data bits (default: 8)"
-                },
-                "parity": {
-                    "type": "string",
-                    "enum": ["none", "even", "odd", "mark", "space"],
-                    "description": "Parity checking (default: none)"
-                },
-                "stopbits": {
-                    "type": "number",
-                    "enum": [1, 1.5, 2],
-                    "description": "Number of stop bits (default: 1)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "device": {
+                "type": "string",
+                "description": "Serial device path (e.g., /dev/ttyUSB0, COM3)"
             },
-            "required": ["device"]
-        }
+            "baudrate": {
+                "type": "number",
+                "description": "Baud rate (default: 9600)"
+            },
+            "bytesize": {
+                "type": "number",
+                "enum": [5, 6, 7, 8],
+                "description": "Number of data bits (default: 8)"
+            },
+            "parity": {
+                "type": "string",
+                "enum": ["none", "even", "odd", "mark", "space"],
+                "description": "Parity checking (default: none)"
+            },
+            "stopbits": {
+                "type": "number",
+                "enum": [1, 1.5, 2],
+                "description": "Number of stop bits (default: 1)"
+            }
+        },
+        "required": ["device"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Open a serial port connection"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         serial_session = self.session_manager.get_serial_session()
         
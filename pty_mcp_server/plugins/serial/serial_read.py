@@ -4,48 +4,34 @@ Serial Read tool - Read data from serial port
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SerialReadTool(BaseTool):
     """Read data from the active serial port"""
     
-    @property
-    def name(self) -> str:
-        return "serial-read"
+    name = "serial-read"
+    description = "Read data from the active serial port"
+    category = "serial"
     
-    @property
-    def description(self) -> str:
-        return "Read data from the active serial port"
-    
-    @property
-    def category(self) -> str:
-        return "serial"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "size": {
-                    "type": "number",
-                    "description": "Number of bytes to read (optional, reads all available if not specified)"
-                },
-                "timeout": {
-                    "type": "number",
-                    "description": "Read timeout in seconds (default: 2.0)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "size": {
+                "type": "number",
+                "description": "Number of bytes to read (optional, reads all available if not specified)"
             },
-            "required": []
-        }
+            "timeout": {
+                "type": "number",
+                "description": "Read timeout in seconds (default: 2.0)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Read from the serial port"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         serial_session = self.session_manager.get_serial_session()
         
@@ -4,44 +4,30 @@ Serial Write tool - Write data to serial port
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SerialWriteTool(BaseTool):
     """Write data to the active serial port"""
     
-    @property
-    def name(self) -> str:
-        return "serial-write"
+    name = "serial-write"
+    description = "Write data to the active serial port"
+    category = "serial"
     
-    @property
-    def description(self) -> str:
-        return "Write data to the active serial port"
-    
-    @property
-    def category(self) -> str:
-        return "serial"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "data": {
-                    "type": "string",
-                    "description": "Data to send through the serial port"
-                }
-            },
-            "required": ["data"]
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "data": {
+                "type": "string",
+                "description": "Data to send through the serial port"
+            }
+        },
+        "required": ["data"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Write to the serial port"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         serial_session = self.session_manager.get_serial_session()
         
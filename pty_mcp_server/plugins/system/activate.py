@@ -3,47 +3,34 @@ Activate project tool
 """
 
 import os
-import json
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.core.manager import ActiveProject
+from pty_mcp_server.lib import fastjson
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class ActivateTool(BaseTool):
     """Activate a project from the registry"""
     
-    @property
-    def name(self) -> str:
-        return "activate"
+    name = "activate"
+    description = "Activate a project from the registry"
+    category = "system"
     
-    @property
-    def description(self) -> str:
-        return "Activate a project from the registry"
-    
-    @property
-    def category(self) -> str:
-        return "system"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "project_name": {
-                    "type": "string",
-                    "description": "Name of the project to activate"
-                }
-            },
-            "required": ["project_name"]
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "project_name": {
+                "type": "string",
+                "description": "Name of the project to activate"
+            }
+        },
+        "required": ["project_name"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Activate a project"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         project_name = arguments.get("project_name")
         projects = self.session_manager.projects_config
@@ -66,11 +53,29 @@ class ActivateTool(BaseTool):
                 error=f"Project path does not exist: {project_path}"
             )
         
+        # Re-activating the current project: already saved, environment loaded
+        project = ActiveProject(project_name, project_path)
+        if (self.session_manager.active_project == project
+                and self.session_manager.env_manager.active_project == project_name):
+            env_config = self.session_manager.env_manager.project_configs.get(project_name, {})
+            result = {
+                "status": "unchanged",
+                "project": project_name,
+                "path": project_path,
+                "environment": {
+                    "loaded": True,
+                    "env_count": env_config.get("env_count", 0),
+                    "note": "Environment applies to 'exec' commands only"
+                }
+            }
+            return ToolResult(
+                success=True,
+                content=fastjson.dumps(result, indent=True),
+                metadata=result
+            )
+        
         # Update active project
-        self.session_manager.active_project = {
-            "name": project_name,
-            "path": project_path
-        }
+        self.session_manager.active_project = project
         self.session_manager.save_active_project()
         
         # Load project-specific environment
@@ -78,9 +83,6 @@ class ActivateTool(BaseTool):
             project_name, project_path
         )
         
-        # Change directory
-        os.chdir(project_path)
-        
         result = {
             "status": "success",
             "project": project_name,
@@ -95,6 +97,6 @@ class ActivateTool(BaseTool):
         
         return ToolResult(
             success=True,
-            content=json.dumps(result, indent=2),
+            content=fastjson.dumps(result, indent=True),
             metadata=result
         )
\ No newline at end of file
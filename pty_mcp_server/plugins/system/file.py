@@ -4,117 +4,176 @@ WITH SAFETY CHECKS
 """
 
 import os
-import json
-from typing import Dict, Any
-
-import sys
+import asyncio
+from typing import Any, Callable, Dict
 
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
+# Default cap on bytes returned by a read
+MAX_READ_BYTES = 10 * 1024 * 1024
+# Writes are issued to the descriptor in slices of this many bytes
+WRITE_CHUNK = 1024 * 1024
+
+
+def _write_file(path: str, content: str) -> None:
+    """Encode content once and write it straight to the descriptor, bypassing buffered IO"""
+    data = memoryview(content.encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        written = 0
+        while written < len(data):
+            # memoryview slices share the buffer; nothing is copied per chunk
+            written += os.write(fd, data[written:written + WRITE_CHUNK])
+    finally:
+        os.close(fd)
+
+
+def _read(path: str, arguments: Dict[str, Any]) -> ToolResult:
+    """Return up to max_bytes of the file, decoded as UTF-8"""
+    max_bytes = int(arguments.get("max_bytes", MAX_READ_BYTES))
+    # Read raw bytes up to the cap and decode once
+    with open(path, 'rb') as f:
+        data = f.read(max_bytes)
+        size = os.fstat(f.fileno()).st_size
+    content = data.decode('utf-8', errors='replace')
+    if size > len(data):
+        content += f"\n... [truncated: showing {len(data)} of {size} bytes]"
+    return ToolResult(success=True, content=content)
+
+
+def _write(path: str, arguments: Dict[str, Any]) -> ToolResult:
+    """Create or (with force) overwrite a file"""
+    content = arguments.get("content", "")
+    force = arguments.get("force", False)
+
+    # Safety check: warn if file exists (one stat gives existence and size)
+    try:
+        file_size = os.stat(path).st_size
+        file_exists = True
+    except FileNotFoundError:
+        file_exists = False
+
+    if file_exists and not force:
+        # File exists and force not specified - require confirmation
+        return ToolResult(
+            success=False,
+            content="",
+            error=f"File already exists at {path} ({file_size} bytes). Use 'force': true to overwrite, or use Claude's Edit tool for safe modifications."
+        )
+
+    # Write the file
+    _write_file(path, content)
+
+    # Return appropriate message
+    if file_exists:
+        return ToolResult(success=True, content=f"File overwritten at {path}")
+    else:
+        return ToolResult(success=True, content=f"File created at {path}")
+
+
+def _list(path: str, arguments: Dict[str, Any]) -> ToolResult:
+    """List directory entries, optionally with type and size"""
+    try:
+        # One directory scan; DirEntry carries type and stat info
+        with os.scandir(path) as it:
+            if arguments.get("detail", False):
+                files = [
+                    f"{e.name}\t{'d' if e.is_dir(follow_symlinks=False) else 'f'}\t{e.stat(follow_symlinks=False).st_size}"
+                    for e in it
+                ]
+            else:
+                files = [e.name for e in it]
+    except (FileNotFoundError, NotADirectoryError):
+        return ToolResult(success=False, content="", error=f"Not a directory: {path}")
+    return ToolResult(success=True, content="\n".join(files))
+
+
+def _delete(path: str, arguments: Dict[str, Any]) -> ToolResult:
+    """Remove a file"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return ToolResult(success=False, content="", error=f"File not found: {path}")
+    return ToolResult(success=True, content=f"Deleted {path}")
+
+
+def _exists(path: str, arguments: Dict[str, Any]) -> ToolResult:
+    """Report whether the path exists"""
+    exists = os.path.exists(path)
+    return ToolResult(success=True, content=str(exists))
+
+
+# Action name -> handler(path, arguments); one hash lookup per call
+_ACTIONS: Dict[str, Callable[[str, Dict[str, Any]], ToolResult]] = {
+    "read": _read,
+    "write": _write,
+    "list": _list,
+    "delete": _delete,
+    "exists": _exists,
+}
+
+
 class FileTool(BaseTool):
     """Simple file operations with safety checks"""
     
-    @property
-    def name(self) -> str:
-        return "file"
-    
-    @property
-    def description(self) -> str:
-        return "File operations: read, write, list, delete"
+    name = "file"
+    description = "File operations: read, write, list, delete"
+    category = "system"
     
-    @property
-    def category(self) -> str:
-        return "system"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["read", "write", "list", "delete", "exists"],
-                    "description": "File operation to perform"
-                },
-                "path": {
-                    "type": "string",
-                    "description": "File or directory path (relative to active project)"
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Content to write (for write action)"
-                },
-                "force": {
-                    "type": "boolean",
-                    "description": "Force overwrite existing files (default: false)",
-                    "default": False
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["read", "write", "list", "delete", "exists"],
+                "description": "File operation to perform"
+            },
+            "path": {
+                "type": "string",
+                "description": "File or directory path (relative to active project)"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write (for write action)"
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Force overwrite existing files (default: false)",
+                "default": False
             },
-            "required": ["action", "path"]
-        }
+            "detail": {
+                "type": "boolean",
+                "description": "For list: include type (d/f) and size per entry, tab separated (default: false)",
+                "default": False
+            },
+            "max_bytes": {
+                "type": "number",
+                "description": f"Maximum bytes to return for read; larger files are truncated (default: {MAX_READ_BYTES})"
+            }
+        },
+        "required": ["action", "path"]
+    }
+    
+    async def execute(self, arguments: Dict[str, Any]) -> ToolResult:
+        """Execute file operation on a worker thread so slow storage never blocks the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute_sync, arguments)
     
-    def execute(self, arguments: Dict[str, Any]) -> ToolResult:
-        """Execute file operation"""
+    def _execute_sync(self, arguments: Dict[str, Any]) -> ToolResult:
+        """Perform the file operation (blocking)"""
         action = arguments.get("action", "")
         path = arguments.get("path", "")
         
         # Use active project as base if path is relative
         if not os.path.isabs(path) and self.session_manager and self.session_manager.active_project:
-            base_path = self.session_manager.active_project.get("path", "")
+            base_path = self.session_manager.active_project.path
             path = os.path.join(base_path, path)
         
         try:
-            if action == "read":
-                with open(path, 'r') as f:
-                    content = f.read()
-                return ToolResult(success=True, content=content)
-            
-            elif action == "write":
-                content = arguments.get("content", "")
-                force = arguments.get("force", False)
-                
-                # Safety check: warn if file exists
-                file_exists = os.path.exists(path)
-                
-                if file_exists and not force:
-                    # File exists and force not specified - require confirmation
-                    file_size = os.path.getsize(path)
-                    return ToolResult(
-                        success=False,
-                        content="",
-                        error=f"File already exists at {path} ({file_size} bytes). Use 'force': true to overwrite, or use Claude's Edit tool for safe modifications."
-                    )
-                
-                # Write the file
-                with open(path, 'w') as f:
-                    f.write(content)
-                
-                # Return appropriate message
-                if file_exists:
-                    return ToolResult(success=True, content=f"File overwritten at {path}")
-                else:
-                    return ToolResult(success=True, content=f"File created at {path}")
-            
-            elif action == "list":
-                if os.path.isdir(path):
-                    files = os.listdir(path)
-                    return ToolResult(success=True, content="\n".join(files))
-                else:
-                    return ToolResult(success=False, content="", error=f"Not a directory: {path}")
-            
-            elif action == "delete":
-                if os.path.exists(path):
-                    os.remove(path)
-                    return ToolResult(success=True, content=f"Deleted {path}")
-                else:
-                    return ToolResult(success=False, content="", error=f"File not found: {path}")
-            
-            elif action == "exists":
-                exists = os.path.exists(path)
-                return ToolResult(success=True, content=str(exists))
-            
-            else:
+            handler = _ACTIONS.get(action)
+            if handler is None:
                 return ToolResult(success=False, content="", error=f"Unknown action: {action}")
-                
+            return handler(path, arguments)
         except Exception as e:
-            return ToolResult(success=False, content="", error=str(e))
\ No newline at end of file
+            return ToolResult(success=False, content="", error=str(e))
@@ -2,42 +2,28 @@
 List projects tool
 """
 
-import json
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib import fastjson
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class ProjectsTool(BaseTool):
     """List all registered projects"""
     
-    @property
-    def name(self) -> str:
-        return "projects"
+    name = "projects"
+    description = "List all registered projects"
+    category = "system"
     
-    @property
-    def description(self) -> str:
-        return "List all registered projects"
-    
-    @property
-    def category(self) -> str:
-        return "system"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """List all projects"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         projects = self.session_manager.projects_config
         default_project = self.session_manager.config.default_project
@@ -46,11 +32,11 @@ class ProjectsTool(BaseTool):
         result = {
             "projects": projects,
             "default": default_project,
-            "active": active.get("name") if active else None
+            "active": active.name if active else None
         }
         
         return ToolResult(
             success=True,
-            content=json.dumps(result, indent=2),
+            content=fastjson.dumps(result, indent=True),
             metadata=result
         )
\ No newline at end of file
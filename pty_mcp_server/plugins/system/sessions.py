@@ -2,43 +2,43 @@
 List all active sessions tool
 """
 
-import json
 import os
-from typing import Dict, Any
+from typing import Any, Dict, Iterator, List
 from datetime import datetime
 
-import sys
-
+from pty_mcp_server.lib import fastjson
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
+
+def _table_rows(sessions: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the lines of the table format"""
+    yield "Active Sessions:"
+    yield "=" * 40
+    for i, session in enumerate(sessions, 1):
+        yield f"{i}. {session['type']} Session"
+        for key, value in session.items():
+            if key != 'type':
+                yield f"   {key}: {value}"
+
+
 class SessionsTool(BaseTool):
     """List and manage sessions"""
     
-    @property
-    def name(self) -> str:
-        return "sessions"
+    name = "sessions"
+    description = "List all active sessions (PTY, process, socket)"
+    category = "system"
     
-    @property
-    def description(self) -> str:
-        return "List all active sessions (PTY, process, socket)"
-    
-    @property
-    def category(self) -> str:
-        return "system"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "format": {
-                    "type": "string",
-                    "enum": ["json", "table", "summary"],
-                    "description": "Output format (default: summary)"
-                }
-            },
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "format": {
+                "type": "string",
+                "enum": ["json", "table", "summary"],
+                "description": "Output format (default: summary)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """List all sessions"""
@@ -54,8 +54,8 @@ class SessionsTool(BaseTool):
         sessions = []
         
         # Check PTY session
-        if self.session_manager.pty_session:
-            pty = self.session_manager.pty_session
+        pty = self.session_manager.pty_session
+        if pty is not None and pty.is_active():
             sessions.append({
                 "type": "PTY",
                 "command": getattr(pty, 'command', 'unknown'),
@@ -64,49 +64,45 @@ class SessionsTool(BaseTool):
             })
         
         # Check process session
-        if self.session_manager.proc_session:
-            proc = self.session_manager.proc_session
-            if hasattr(proc, 'process') and proc.process:
+        proc = self.session_manager.proc_session
+        if proc:
+            process = getattr(proc, 'process', None)
+            if process:
                 sessions.append({
                     "type": "Process",
-                    "pid": proc.process.pid,
-                    "active": proc.process.poll() is None
+                    "pid": process.pid,
+                    "active": process.poll() is None
                 })
         
         # Check socket session
-        if self.session_manager.socket_session:
-            sock = self.session_manager.socket_session
+        sock = self.session_manager.socket_session
+        if sock:
+            active = sock.is_active()
             socket_info = {
                 "type": "Socket",
-                "active": sock.is_active()
+                "active": active
             }
             # Add connection details if available
-            if sock.is_active() and hasattr(sock, 'host'):
-                socket_info["host"] = getattr(sock, 'host', 'unknown')
+            if active and hasattr(sock, 'host'):
+                socket_info["host"] = sock.host
                 socket_info["port"] = getattr(sock, 'port', 'unknown')
             sessions.append(socket_info)
         
         # Format output
         if format_type == "json":
-            content = json.dumps(sessions, indent=2)
+            content = fastjson.dumps(sessions, indent=True)
         elif format_type == "table":
             if not sessions:
                 content = "No active sessions"
             else:
-                lines = ["Active Sessions:", "=" * 40]
-                for i, session in enumerate(sessions, 1):
-                    lines.append(f"{i}. {session['type']} Session")
-                    for key, value in session.items():
-                        if key != 'type':
-                            lines.append(f"   {key}: {value}")
-                content = "\n".join(lines)
+                content = "\n".join(_table_rows(sessions))
         else:  # summary
             active_count = len(sessions)
             if active_count == 0:
                 content = "No active sessions"
             else:
-                types = [s['type'] for s in sessions]
-                content = f"{active_count} active session(s): {', '.join(types)}"
+                types = ', '.join(s['type'] for s in sessions)
+                content = f"{active_count} active session(s): {types}"
         
         return ToolResult(
             success=True,
@@ -3,40 +3,27 @@ Get status of active sessions and processes
 """
 
 import os
-import json
 from typing import Dict, Any
 
-import sys
-
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
 class StatusTool(BaseTool):
     """Get status of active sessions"""
     
-    @property
-    def name(self) -> str:
-        return "status"
-    
-    @property
-    def description(self) -> str:
-        return "Get status of active PTY, process, and socket sessions"
-    
-    @property
-    def category(self) -> str:
-        return "system"
+    name = "status"
+    description = "Get status of active PTY, process, and socket sessions"
+    category = "system"
     
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "verbose": {
-                    "type": "boolean",
-                    "description": "Include detailed information (default: false)"
-                }
-            },
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "verbose": {
+                "type": "boolean",
+                "description": "Include detailed information (default: false)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Get session status"""
@@ -58,8 +45,8 @@ class StatusTool(BaseTool):
         }
         
         # Check PTY session
-        if self.session_manager.pty_session:
-            pty = self.session_manager.pty_session
+        pty = self.session_manager.pty_session
+        if pty is not None:
             if pty.is_active():
                 status["pty_session"] = {
                     "active": True,
@@ -120,7 +107,7 @@ class StatusTool(BaseTool):
         display_status.append(f"Socket Session: {'Active' if status['socket_session'] else 'None'}")
         display_status.append(f"Serial Session: {'Active' if status['serial_session'] else 'None'}")
         if status['active_project']:
-            display_status.append(f"Active Project: {status['active_project']['name']} ({status['active_project']['path']})")
+            display_status.append(f"Active Project: {status['active_project'].name} ({status['active_project'].path})")
         else:
             display_status.append("Active Project: None")
         
@@ -4,44 +4,30 @@ Bash PTY tool - Start an interactive bash session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class BashTool(BaseTool):
     """Start an interactive bash PTY session"""
     
-    @property
-    def name(self) -> str:
-        return "bash"
+    name = "bash"
+    description = "Start an interactive bash shell in PTY"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Start an interactive bash shell in PTY"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "working_dir": {
-                    "type": "string",
-                    "description": "Initial working directory"
-                }
-            },
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "working_dir": {
+                "type": "string",
+                "description": "Initial working directory"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start bash PTY session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
@@ -57,7 +43,7 @@ class BashTool(BaseTool):
         
         # Use active project directory if available
         if not working_dir and self.session_manager.active_project:
-            working_dir = self.session_manager.active_project.get("path")
+            working_dir = self.session_manager.active_project.path
         
         try:
             pty_session.start("bash", [], working_dir)
@@ -5,55 +5,37 @@ Clear terminal screen tool
 import os
 from typing import Dict, Any
 
-import sys
-
 from pty_mcp_server.lib.base import BaseTool, ToolResult
 
 class ClearTool(BaseTool):
     """Clear the terminal screen"""
     
-    @property
-    def name(self) -> str:
-        return "clear"
-    
-    @property
-    def description(self) -> str:
-        return "Clear the terminal screen"
+    name = "clear"
+    description = "Clear the terminal screen"
+    category = "terminal"
     
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Clear the terminal"""
         
-        if not self.session_manager or not self.session_manager.pty_session:
-            # No PTY session - clear using system command
-            try:
-                os.system('clear' if os.name == 'posix' else 'cls')
-                return ToolResult(
-                    success=True,
-                    content="Terminal cleared"
-                )
-            except:
-                return ToolResult(
-                    success=False,
-                    content="",
-                    error="Failed to clear terminal"
-                )
+        # The session may exist but be idle (e.g. created by PTY_MCP_WARMUP).
+        # There is no local terminal to fall back to: the server's stdout is
+        # the MCP transport.
+        pty = self.session_manager.pty_session if self.session_manager else None
+        if pty is None or not pty.is_active():
+            return ToolResult(
+                success=False,
+                content="",
+                error="No active PTY session to clear"
+            )
         
         # Have PTY session - send clear command
         try:
-            pty = self.session_manager.pty_session
-            
             # Send clear escape sequence
             clear_sequence = "\033[2J\033[H"  # Clear screen and move cursor to home
             os.write(pty.master_fd, clear_sequence.encode())
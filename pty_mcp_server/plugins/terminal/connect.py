@@ -4,53 +4,39 @@ PTY Connect tool - Start a PTY session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class ConnectTool(BaseTool):
     """Start a PTY session with a command"""
     
-    @property
-    def name(self) -> str:
-        return "connect"
+    name = "connect"
+    description = "Start a new PTY session with a specified command"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Start a new PTY session with a specified command"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "Command to run in PTY"
-                },
-                "args": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Command arguments"
-                },
-                "working_dir": {
-                    "type": "string",
-                    "description": "Working directory"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": "Command to run in PTY"
             },
-            "required": ["command"]
-        }
+            "args": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Command arguments"
+            },
+            "working_dir": {
+                "type": "string",
+                "description": "Working directory"
+            }
+        },
+        "required": ["command"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start a PTY session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
@@ -68,13 +54,13 @@ class ConnectTool(BaseTool):
         
         # Use active project directory if available
         if not working_dir and self.session_manager.active_project:
-            working_dir = self.session_manager.active_project.get("path")
+            working_dir = self.session_manager.active_project.path
         
         try:
             pty_session.start(command, args, working_dir)
             
-            # Read initial output
-            output = pty_session.read(timeout=1.0)
+            # Read initial output, stopping early once the program is ready
+            output = pty_session.wait_ready(timeout=1.0)
             
             return ToolResult(
                 success=True,
@@ -4,39 +4,25 @@ PTY Disconnect tool - Terminate PTY session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class DisconnectTool(BaseTool):
     """Terminate active PTY session"""
     
-    @property
-    def name(self) -> str:
-        return "disconnect"
+    name = "disconnect"
+    description = "Terminate the active PTY session"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Terminate the active PTY session"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Terminate PTY session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
@@ -14,41 +14,32 @@ from pty_mcp_server.lib.base import BaseTool, ToolResult
 class ResizeTool(BaseTool):
     """Resize the terminal window"""
     
-    @property
-    def name(self) -> str:
-        return "resize"
+    name = "resize"
+    description = "Resize the terminal window dimensions"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Resize the terminal window dimensions"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "width": {
-                    "type": "number",
-                    "description": "Terminal width in columns (default: 80)"
-                },
-                "height": {
-                    "type": "number", 
-                    "description": "Terminal height in rows (default: 24)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "width": {
+                "type": "number",
+                "description": "Terminal width in columns (default: 80)"
             },
-            "required": []
-        }
+            "height": {
+                "type": "number", 
+                "description": "Terminal height in rows (default: 24)"
+            }
+        },
+        "required": []
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Resize the terminal"""
         width = arguments.get("width", 80)
         height = arguments.get("height", 24)
         
-        if not self.session_manager or not self.session_manager.pty_session:
+        pty = self.session_manager.pty_session if self.session_manager else None
+        if pty is None or not pty.is_active():
             return ToolResult(
                 success=False,
                 content="",
@@ -57,7 +48,7 @@ class ResizeTool(BaseTool):
         
         try:
             # Get the PTY file descriptor
-            fd = self.session_manager.pty_session.master_fd
+            fd = pty.master_fd
             
             # Set terminal window size using ioctl
             winsize = struct.pack("HHHH", height, width, 0, 0)
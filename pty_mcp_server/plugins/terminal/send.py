@@ -4,44 +4,30 @@ PTY Send tool - Send input to active PTY session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SendTool(BaseTool):
     """Send input to active PTY session"""
     
-    @property
-    def name(self) -> str:
-        return "send"
+    name = "send"
+    description = "Send input to the active PTY session"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Send input to the active PTY session"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "Text to send to PTY"
-                }
-            },
-            "required": ["message"]
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "Text to send to PTY"
+            }
+        },
+        "required": ["message"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Send input to PTY session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
@@ -4,56 +4,42 @@ SSH tool - SSH connections via PTY
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class SSHTool(BaseTool):
     """Connect to remote host via SSH"""
     
-    @property
-    def name(self) -> str:
-        return "ssh"
+    name = "ssh"
+    description = "Connect to a remote host via SSH"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Connect to a remote host via SSH"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "description": "SSH host to connect to"
-                },
-                "user": {
-                    "type": "string",
-                    "description": "SSH username"
-                },
-                "port": {
-                    "type": "number",
-                    "description": "SSH port (default: 22)"
-                },
-                "key_file": {
-                    "type": "string",
-                    "description": "Path to SSH private key file (optional)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "SSH host to connect to"
+            },
+            "user": {
+                "type": "string",
+                "description": "SSH username"
+            },
+            "port": {
+                "type": "number",
+                "description": "SSH port (default: 22)"
             },
-            "required": ["host"]
-        }
+            "key_file": {
+                "type": "string",
+                "description": "Path to SSH private key file (optional)"
+            }
+        },
+        "required": ["host"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start SSH session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
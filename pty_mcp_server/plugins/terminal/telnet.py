@@ -4,48 +4,34 @@ Telnet tool - Telnet connections via PTY
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 class TelnetTool(BaseTool):
     """Connect to remote host via Telnet"""
     
-    @property
-    def name(self) -> str:
-        return "telnet"
+    name = "telnet"
+    description = "Connect to a remote host via Telnet"
+    category = "terminal"
     
-    @property
-    def description(self) -> str:
-        return "Connect to a remote host via Telnet"
-    
-    @property
-    def category(self) -> str:
-        return "terminal"
-    
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "host": {
-                    "type": "string",
-                    "description": "Telnet host to connect to"
-                },
-                "port": {
-                    "type": "number",
-                    "description": "Telnet port (default: 23)"
-                }
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "host": {
+                "type": "string",
+                "description": "Telnet host to connect to"
             },
-            "required": ["host"]
-        }
+            "port": {
+                "type": "number",
+                "description": "Telnet port (default: 23)"
+            }
+        },
+        "required": ["host"]
+    }
     
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start Telnet session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
         
         pty_session = self.session_manager.get_pty_session()
         
@@ -4,48 +4,34 @@ Tmux Attach tool - Get the command to manually attach to a session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 
 class TmuxAttachTool(BaseTool):
     """Get the command to manually attach to a tmux session"""
 
-    @property
-    def name(self) -> str:
-        return "tmux-attach"
-
-    @property
-    def description(self) -> str:
-        return ("Get the command to manually attach to a tmux session. "
-                "Returns the 'tmux attach' command you can run. "
-                "Once attached, use Ctrl+B, D to detach (process keeps running). "
-                "This provides TRUE mid-execution backgrounding!")
-
-    @property
-    def category(self) -> str:
-        return "tmux"
-
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "session_name": {
-                    "type": "string",
-                    "description": "Session to get attach command for"
-                }
-            },
-            "required": ["session_name"]
-        }
+    name = "tmux-attach"
+    description = ("Get the command to manually attach to a tmux session. "
+            "Returns the 'tmux attach' command you can run. "
+            "Once attached, use Ctrl+B, D to detach (process keeps running). "
+            "This provides TRUE mid-execution backgrounding!")
+    category = "tmux"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "session_name": {
+                "type": "string",
+                "description": "Session to get attach command for"
+            }
+        },
+        "required": ["session_name"]
+    }
 
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Get attach command"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
 
         tmux_manager = self.session_manager.get_tmux_manager()
 
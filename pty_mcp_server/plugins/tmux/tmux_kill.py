@@ -4,47 +4,33 @@ Tmux Kill tool - Kill a tmux session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 
 class TmuxKillTool(BaseTool):
     """Kill a tmux session and stop its process"""
 
-    @property
-    def name(self) -> str:
-        return "tmux-kill"
-
-    @property
-    def description(self) -> str:
-        return ("Kill a tmux session and stop its process. "
-                "Terminates the session and all processes running in it. "
-                "Use this to clean up when done.")
-
-    @property
-    def category(self) -> str:
-        return "tmux"
-
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "session_name": {
-                    "type": "string",
-                    "description": "Session to kill"
-                }
-            },
-            "required": ["session_name"]
-        }
+    name = "tmux-kill"
+    description = ("Kill a tmux session and stop its process. "
+            "Terminates the session and all processes running in it. "
+            "Use this to clean up when done.")
+    category = "tmux"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "session_name": {
+                "type": "string",
+                "description": "Session to kill"
+            }
+        },
+        "required": ["session_name"]
+    }
 
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Kill tmux session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
 
         tmux_manager = self.session_manager.get_tmux_manager()
 
@@ -4,40 +4,26 @@ Tmux List tool - List all active tmux sessions
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 
 class TmuxListTool(BaseTool):
     """List all active tmux sessions"""
 
-    @property
-    def name(self) -> str:
-        return "tmux-list"
+    name = "tmux-list"
+    description = "List all active tmux sessions. Shows session names, creation time, and attachment status."
+    category = "tmux"
 
-    @property
-    def description(self) -> str:
-        return "List all active tmux sessions. Shows session names, creation time, and attachment status."
-
-    @property
-    def category(self) -> str:
-        return "tmux"
-
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
 
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """List tmux sessions"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
 
         tmux_manager = self.session_manager.get_tmux_manager()
 
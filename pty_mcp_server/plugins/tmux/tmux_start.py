@@ -4,52 +4,38 @@ Tmux Start tool - Start a new tmux session
 
 from typing import Dict, Any
 
-from pty_mcp_server.lib.base import BaseTool, ToolResult
+from pty_mcp_server.lib.base import BaseTool, ToolResult, NO_SESSION_MGR
 
 
 class TmuxStartTool(BaseTool):
     """Start a new detached tmux session"""
 
-    @property
-    def name(self) -> str:
-        return "tmux-start"
-
-    @property
-    def description(self) -> str:
-        return ("Start a new tmux session with a command. "
-                "The session runs in background and can be attached/detached anytime. "
-                "Use this for servers, databases, REPLs, or any long-running process. "
-                "True mid-execution backgrounding with Ctrl+B, D")
-
-    @property
-    def category(self) -> str:
-        return "tmux"
-
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "session_name": {
-                    "type": "string",
-                    "description": "Unique name for the tmux session"
-                },
-                "command": {
-                    "type": "string",
-                    "description": "Command to run in the session"
-                }
+    name = "tmux-start"
+    description = ("Start a new tmux session with a command. "
+            "The session runs in background and can be attached/detached anytime. "
+            "Use this for servers, databases, REPLs, or any long-running process. "
+            "True mid-execution backgrounding with Ctrl+B, D")
+    category = "tmux"
+
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "session_name": {
+                "type": "string",
+                "description": "Unique name for the tmux session"
             },
-            "required": ["session_name", "command"]
-        }
+            "command": {
+                "type": "string",
+                "description": "Command to run in the session"
+            }
+        },
+        "required": ["session_name", "command"]
+    }
 
     def execute(self, arguments: Dict[str, Any]) -> ToolResult:
         """Start a tmux session"""
         if not self.session_manager:
-            return ToolResult(
-                success=False,
-                content="",
-                error="No session manager available"
-            )
+            return NO_SESSION_MGR
 
         tmux_manager = self.session_manager.get_tmux_manager()
 
@@ -64,8 +50,13 @@ class TmuxStartTool(BaseTool):
         session_name = arguments.get("session_name")
         command = arguments.get("command")
 
+        # Start in the active project directory, if any
+        working_dir = None
+        if self.session_manager.active_project:
+            working_dir = self.session_manager.active_project.path
+
         try:
-            result = tmux_manager.start_session(session_name, command)
+            result = tmux_manager.start_session(session_name, command, working_dir)
 
             if not result["success"]:
                 return ToolResult(
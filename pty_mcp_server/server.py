@@ -5,12 +5,12 @@ This preserves all existing tools and just adds proper MCP protocol
 """
 import os
 import sys
-import json
 import asyncio
 import logging
+import logging.handlers
+import queue
 import tempfile
 from typing import Any, Dict, List, Optional
-from pathlib import Path
 
 # MCP SDK imports
 from mcp.server import Server, NotificationOptions
@@ -20,16 +20,20 @@ import mcp.types as types
 
 # Import existing PTY architecture
 from pty_mcp_server.core.manager import SessionManager
-from pty_mcp_server.lib.registry import ToolRegistry
+from pty_mcp_server.lib.registry import ToolRegistry, default_manifest_path
 from pty_mcp_server.lib.base import ToolResult
+from pty_mcp_server.lib import fastjson
 
 # Set up logging - redirect to file to avoid interfering with stdio
 # Use cross-platform temp directory
 log_path = os.path.join(tempfile.gettempdir(), 'pty-mcp.log')
+# Handlers only enqueue records; the listener thread started in main() does the file I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.FileHandler(log_path))
 logging.basicConfig(
     level=logging.INFO,
     format='[%(levelname)s] %(message)s',
-    handlers=[logging.FileHandler(log_path)]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -40,33 +44,38 @@ server = Server("pty-mcp-server")
 session_manager: Optional[SessionManager] = None
 tool_registry: Optional[ToolRegistry] = None
 
-@server.list_tools()
-async def list_tools() -> List[types.Tool]:
-    """List all available tools from the existing plugin architecture"""
-    global tool_registry
-    
-    if not tool_registry:
-        return []
+# Schema advertised for tools that don't declare one
+_DEFAULT_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+
+# MCP tool definitions, built once after plugins are loaded
+_tool_list: List[types.Tool] = []
+
+def _build_tool_list(registry: ToolRegistry) -> List[types.Tool]:
+    """Convert the registry's MCP definitions to SDK tool objects
     
+    The registry is the single source of truth: call_tool dispatches through
+    the same name -> tool mapping that is advertised here.
+    """
     tools = []
     
-    # Convert existing tools to MCP format
-    for tool_name, tool_instance in tool_registry._tools.items():
+    for definition in registry.list_tools():
         try:
-            # Get tool metadata from existing architecture
-            mcp_tool = types.Tool(
-                name=tool_instance.name,
-                description=tool_instance.description,
-                inputSchema=tool_instance.input_schema
-            )
-            tools.append(mcp_tool)
-            logger.info(f"Registered tool: {tool_instance.name}")
+            tools.append(types.Tool(
+                name=definition["name"],
+                description=definition.get("description") or "",
+                inputSchema=definition.get("inputSchema") or _DEFAULT_SCHEMA
+            ))
         except Exception as e:
-            logger.error(f"Error registering tool {tool_name}: {e}")
+            logger.error(f"Error registering tool {definition.get('name')}: {e}")
     
-    logger.info(f"Listed {len(tools)} tools")
+    logger.info(f"Registered {len(tools)} MCP tools")
     return tools
 
+@server.list_tools()
+async def list_tools() -> List[types.Tool]:
+    """List all available tools from the existing plugin architecture"""
+    return _tool_list
+
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Execute a tool using the existing plugin architecture"""
@@ -79,14 +88,12 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
                 text="Error: Tool registry not initialized"
             )]
         
-        # Execute using existing tool infrastructure
-        result = tool_registry.execute(name, arguments)
+        # Registry keys are interned; intern the incoming name to match
+        name = sys.intern(name)
         
-        if result is None:
-            return [types.TextContent(
-                type="text",
-                text=f"Error: Tool '{name}' not found"
-            )]
+        # Execute using existing tool infrastructure; take the ToolResult
+        # directly rather than round-tripping through an MCP response dict
+        result = await tool_registry.execute_tool_async(name, arguments)
         
         # Handle different result types
         if isinstance(result, ToolResult):
@@ -105,7 +112,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
             # Some tools return dicts directly
             return [types.TextContent(
                 type="text",
-                text=json.dumps(result, indent=2)
+                text=fastjson.dumps(result, indent=True)
             )]
         else:
             # Plain string result
@@ -115,9 +122,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
             )]
             
     except Exception as e:
-        logger.error(f"Error executing tool {name}: {e}")
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        logger.error("Error executing tool %s", name, exc_info=e)
         return [types.TextContent(
             type="text",
             text=f"Error: {str(e)}"
@@ -125,17 +130,18 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextCont
 
 async def main():
     """Main entry point for the MCP server"""
-    global session_manager, tool_registry
+    global session_manager, tool_registry, _tool_list
     
+    _log_listener.start()
     try:
         # Initialize the existing architecture components
         session_manager = SessionManager()
         logger.info("Session manager initialized")
         
-        tool_registry = ToolRegistry(session_manager)
+        tool_registry = ToolRegistry(session_manager, manifest_path=default_manifest_path())
         
         # Load all plugins from the existing architecture
-        base_dir = Path(__file__).parent
+        base_dir = os.path.dirname(os.path.abspath(__file__))
         loaded_categories = tool_registry.load_all_plugins(base_dir)
         
         total_tools = sum(loaded_categories.values())  # values are already counts
@@ -144,6 +150,8 @@ async def main():
         for category, count in loaded_categories.items():
             logger.info(f"  {category}: {count} tools")
         
+        _tool_list = _build_tool_list(tool_registry)
+        
         # Run the MCP server with stdio
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             logger.info("PTY MCP Server starting with proper MCP SDK...")
@@ -171,9 +179,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {e}")
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        logger.error("Server error", exc_info=e)
         raise
     finally:
         # Cleanup sessions
@@ -184,6 +190,7 @@ async def main():
                 logger.info("Cleanup complete")
             except:
                 pass
+        _log_listener.stop()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
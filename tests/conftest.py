@@ -5,8 +5,10 @@ import pytest
 import sys
 from pathlib import Path
 
-# Add project to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project to path (once, even if conftest is re-imported)
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 @pytest.fixture
 def session_manager():
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Comprehensive test for DDD restructure changes
-Tests all 37 tools including 6 tmux tools from current source
+Tests all 38 tools including 6 tmux tools from current source
 """
 
 import sys
@@ -185,7 +185,7 @@ def test_ddd_architecture():
     print("="*70)
 
     all_pass = (
-        total_tools == 37 and
+        total_tools == 38 and
         loaded.get('tmux', 0) == 6 and
         tools_with_di == total_tools and
         docs_exist
@@ -196,7 +196,7 @@ def test_ddd_architecture():
         print(f"\n🎯 DDD Architecture: FULLY IMPLEMENTED")
         print(f"   - Domain Layer: SessionManager + 5 session types")
         print(f"   - Application Layer: ToolRegistry with Factory Pattern")
-        print(f"   - Interface Layer: 37 tools across 6 categories")
+        print(f"   - Interface Layer: 38 tools across 6 categories")
         print(f"   - 100% Dependency Injection: {tools_with_di}/{total_tools} tools")
         print(f"\n📚 Documentation: COMPLETE")
         print(f"   - Architecture guides with DDD explanation")
@@ -207,12 +207,12 @@ def test_ddd_architecture():
         print(f"   - Pytest fixtures for DI testing")
         print(f"\n🆕 Tmux Integration: WORKING")
         print(f"   - 6 new tools for multi-session management")
-        print(f"   - Total: 31 (original) + 6 (tmux) = 37 tools")
+        print(f"   - Total: 32 (original) + 6 (tmux) = 38 tools")
 
         return 0
     else:
         print("❌ SOME TESTS FAILED")
-        print(f"   Total tools: {total_tools}/37")
+        print(f"   Total tools: {total_tools}/38")
         print(f"   Tmux tools: {loaded.get('tmux', 0)}/6")
         print(f"   DI coverage: {tools_with_di}/{total_tools}")
         return 1
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Comprehensive test suite for the refactored PTY MCP Server package
-Tests all 37 tools to ensure they load and work properly
+Tests all 38 tools to ensure they load and work properly
 """
 
 import json
@@ -179,13 +179,13 @@ proc.terminate()
         
         print(f"Tools loaded: {tool_count}")
         
-        if tool_count == 37:
-            print(f"✅ All 37 tools loaded successfully")
+        if tool_count == 38:
+            print(f"✅ All 38 tools loaded successfully")
             
             # List tools by category
             categories = {
                 'terminal': ['connect', 'send', 'disconnect', 'bash', 'clear', 'resize'],
-                'process': ['spawn', 'send-proc', 'kill-proc', 'ssh-proc', 'proc-cmd', 'proc-ps'],
+                'process': ['spawn', 'send-proc', 'kill-proc', 'ssh-proc', 'ssh-close', 'proc-cmd', 'proc-ps'],
                 'network': ['socket-open', 'socket-write', 'socket-read', 'socket-message', 
                            'socket-telnet', 'socket-close', 'ssh', 'telnet'],
                 'serial': ['serial-open', 'serial-write', 'serial-read', 'serial-message', 'serial-close'],
@@ -198,7 +198,7 @@ proc.terminate()
             
             return True, tool_count
         else:
-            print(f"❌ Expected 37 tools, got {tool_count}")
+            print(f"❌ Expected 38 tools, got {tool_count}")
             if tools:
                 print(f"   Tools found: {', '.join(tools[:10])}...")
             return False, tool_count
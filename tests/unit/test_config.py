@@ -0,0 +1,104 @@
+"""
+Unit tests for ProjectConfig persistence
+"""
+
+import json
+
+from pty_mcp_server.lib.config import ProjectConfig
+
+
+def make_config(tmp_path):
+    """Build a ProjectConfig rooted in a temporary directory"""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir(exist_ok=True)
+    return ProjectConfig(
+        base_dir=str(tmp_path),
+        config_path=str(config_dir / "projects.json"),
+        state_path=str(tmp_path / ".active_project"),
+        projects={}
+    )
+
+
+def test_load_missing_files(tmp_path):
+    config = make_config(tmp_path)
+    config.load()
+    assert config.projects == {}
+    assert config.default_project is None
+    assert config.active_project is None
+
+
+def test_save_then_load_roundtrip(tmp_path):
+    config = make_config(tmp_path)
+    config.projects = {"demo": str(tmp_path)}
+    config.default_project = "demo"
+    config.active_project = "demo"
+    config.save()
+
+    loaded = make_config(tmp_path)
+    loaded.load()
+    assert loaded.projects == {"demo": str(tmp_path)}
+    assert loaded.default_project == "demo"
+    assert loaded.active_project == "demo"
+
+
+def test_loaded_projects_are_not_shared(tmp_path):
+    config = make_config(tmp_path)
+    with open(config.config_path, "w") as f:
+        json.dump({"projects": {"a": "/a"}}, f)
+
+    first = make_config(tmp_path)
+    first.load()
+    first.projects["b"] = "/b"
+
+    second = make_config(tmp_path)
+    second.load()
+    assert second.projects == {"a": "/a"}
+
+
+def test_save_invalidates_cached_parse(tmp_path):
+    config = make_config(tmp_path)
+    config.projects = {"a": "/a"}
+    config.save()
+    config.load()
+
+    config.projects = {"a": "/a", "b": "/b"}
+    config.save()
+
+    reloaded = make_config(tmp_path)
+    reloaded.load()
+    assert reloaded.projects == {"a": "/a", "b": "/b"}
+
+
+def test_legacy_state_file_is_migrated(tmp_path):
+    config = make_config(tmp_path)
+    with open(config.config_path, "w") as f:
+        json.dump({"projects": {"demo": "/demo"}}, f)
+    with open(config.state_path, "w") as f:
+        f.write("demo\n")
+
+    config.load()
+    assert config.active_project == "demo"
+
+    config.save()
+    assert not (tmp_path / ".active_project").exists()
+    with open(config.config_path) as f:
+        assert json.load(f)["active"] == "demo"
+
+    reloaded = make_config(tmp_path)
+    reloaded.load()
+    assert reloaded.active_project == "demo"
+
+
+def test_unchanged_save_skips_write(tmp_path):
+    config = make_config(tmp_path)
+    config.projects = {"a": "/a"}
+    config.save()
+    first = (tmp_path / "config" / "projects.json").stat().st_ino
+
+    config.save()
+    assert (tmp_path / "config" / "projects.json").stat().st_ino == first
+
+    config.active_project = "a"
+    config.save()
+    with open(config.config_path) as f:
+        assert json.load(f)["active"] == "a"
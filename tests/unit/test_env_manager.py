@@ -0,0 +1,99 @@
+"""
+Unit tests for ProjectEnvironmentManager
+"""
+
+import os
+
+from pty_mcp_server.lib.env_manager import ProjectEnvironmentManager
+
+
+def test_load_without_env_file(tmp_path):
+    manager = ProjectEnvironmentManager()
+    result = manager.load_project_env("demo", str(tmp_path))
+
+    assert result["success"]
+    assert result["env_file_found"] is False
+    assert result["env_file"] is None
+    assert manager.get_project_env("demo") == {
+        "PROJECT_NAME": "demo",
+        "PROJECT_PATH": str(tmp_path)
+    }
+
+
+def test_load_parses_env_file(tmp_path):
+    (tmp_path / ".env").write_text(
+        "# comment\n"
+        "\n"
+        "PLAIN=value\n"
+        "SPACED = spaced value \n"
+        "DOUBLE=\"quoted\"\n"
+        "SINGLE='quoted'\n"
+        "URL=http://host/?a=b\n"
+    )
+    manager = ProjectEnvironmentManager()
+    result = manager.load_project_env("demo", str(tmp_path))
+
+    assert result["success"]
+    assert result["env_file_found"] is True
+    env = manager.get_project_env("demo")
+    assert env["PLAIN"] == "value"
+    assert env["SPACED"] == "spaced value"
+    assert env["DOUBLE"] == "quoted"
+    assert env["SINGLE"] == "quoted"
+    assert env["URL"] == "http://host/?a=b"
+
+
+def test_merged_env_overlays_project(tmp_path, monkeypatch):
+    monkeypatch.setenv("PTY_MCP_TEST_BASE", "base")
+    (tmp_path / ".env").write_text("PTY_MCP_TEST_BASE=project\n")
+    manager = ProjectEnvironmentManager()
+
+    assert manager.get_merged_env()["PTY_MCP_TEST_BASE"] == "base"
+
+    manager.load_project_env("demo", str(tmp_path))
+    assert manager.get_merged_env()["PTY_MCP_TEST_BASE"] == "project"
+
+    manager.clear_project_env("demo")
+    assert manager.active_project is None
+    assert manager.get_merged_env()["PTY_MCP_TEST_BASE"] == "base"
+
+
+def test_merged_env_is_reused_until_overrides_change(tmp_path):
+    manager = ProjectEnvironmentManager()
+    assert not manager.has_overrides()
+
+    base = manager.get_merged_env()
+    assert manager.get_merged_env() is base
+
+    manager.load_project_env("demo", str(tmp_path))
+    assert manager.has_overrides()
+    merged = manager.get_merged_env()
+    assert merged is not base
+    assert merged["PROJECT_NAME"] == "demo"
+    assert manager.get_merged_env() is merged
+
+
+def test_merged_env_reloads_changed_env_file(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("COLOR=red\n")
+    manager = ProjectEnvironmentManager()
+    manager.load_project_env("demo", str(tmp_path))
+    assert manager.get_merged_env()["COLOR"] == "red"
+
+    env_file.write_text("COLOR=blue\n")
+    # Force a distinct mtime regardless of filesystem timestamp granularity
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert manager.get_merged_env()["COLOR"] == "blue"
+
+
+def test_project_matching_base_env_has_no_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROJECT_NAME", "demo")
+    monkeypatch.setenv("PROJECT_PATH", str(tmp_path))
+    manager = ProjectEnvironmentManager()
+    manager.load_project_env("demo", str(tmp_path))
+    assert not manager.has_overrides()
+
+    (tmp_path / ".env").write_text("EXTRA=1\n")
+    manager.load_project_env("demo", str(tmp_path))
+    assert manager.has_overrides()
@@ -0,0 +1,18 @@
+"""
+Unit tests for ProcessSession output handling
+"""
+
+from pty_mcp_server.core.sessions.process import ProcessSession
+
+
+def test_read_keeps_utf8_split_across_reads():
+    session = ProcessSession()
+    session.start("sh", ["-c", "printf '\\303'; sleep 0.5; printf '\\251\\n'; sleep 5"])
+    try:
+        first = session.read(timeout=0.2)
+        second = session.read(timeout=1.0)
+    finally:
+        session.terminate()
+
+    assert first == ""
+    assert second == "é\n"
@@ -0,0 +1,45 @@
+"""
+Unit tests for PTYSession output handling
+"""
+
+import time
+
+from pty_mcp_server.core.sessions.pty import PTYSession
+
+
+def test_read_strips_escapes_and_keeps_utf8():
+    session = PTYSession()
+    session.start("printf", ["\\033[?2004h\u65e5\u672c\\033[K\\033[31mred\\033[0m\\n"])
+    try:
+        output = session.wait_ready(timeout=2.0)
+    finally:
+        session.terminate()
+
+    assert output == "\u65e5\u672c\x1b[31mred\x1b[0m\r\n"
+
+
+def test_wait_ready_returns_at_prompt():
+    session = PTYSession()
+    session.start("sh", ["-c", "printf 'ready$ '; sleep 5"])
+    try:
+        started = time.monotonic()
+        output = session.wait_ready(timeout=3.0)
+        elapsed = time.monotonic() - started
+    finally:
+        session.terminate()
+
+    assert output.endswith("ready$ ")
+    assert elapsed < 1.0
+
+
+def test_read_keeps_utf8_split_across_reads():
+    session = PTYSession()
+    session.start("sh", ["-c", "printf '\\303'; sleep 0.5; printf '\\251\\n'; sleep 5"])
+    try:
+        first = session.read(timeout=0.2)
+        second = session.read(timeout=1.0)
+    finally:
+        session.terminate()
+
+    assert first == ""
+    assert second == "é\r\n"
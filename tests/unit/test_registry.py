@@ -0,0 +1,73 @@
+"""
+Unit tests for ToolRegistry plugin loading
+"""
+
+import pytest
+
+from pty_mcp_server.lib.registry import ToolRegistry
+
+
+def test_listed_definitions_match_imported_tools(base_dir, tmp_path):
+    registry = ToolRegistry(manifest_path=str(tmp_path / "plugins.json"))
+    counts = registry.load_all_plugins(str(base_dir))
+
+    definitions = registry.list_tools()
+    assert len(definitions) == len(registry) == sum(counts.values())
+    for definition in definitions:
+        tool = registry.get_tool(definition["name"])
+        assert tool is not None
+        assert tool.mcp_definition == definition
+
+
+def test_lazy_tool_executes(base_dir, tmp_path):
+    registry = ToolRegistry(manifest_path=str(tmp_path / "plugins.json"))
+    registry.load_all_plugins(str(base_dir))
+
+    assert "tmux-list" in registry
+    assert "tmux-list" in registry.list_by_category("tmux")
+    result = registry.execute_tool("tmux-list", {})
+    assert not result.success
+    assert result.error == "No session manager available"
+
+
+def test_manifest_is_reused(base_dir, tmp_path):
+    manifest = tmp_path / "cache" / "plugins.json"
+    first = ToolRegistry(manifest_path=str(manifest))
+    first.load_all_plugins(str(base_dir))
+    assert manifest.exists()
+    written = manifest.stat().st_mtime_ns
+
+    second = ToolRegistry(manifest_path=str(manifest))
+    second.load_all_plugins(str(base_dir))
+    assert second.list_tools() == first.list_tools()
+    # Nothing was rescanned, so the manifest was not rewritten
+    assert manifest.stat().st_mtime_ns == written
+
+
+def test_corrupt_manifest_is_ignored(base_dir, tmp_path):
+    manifest = tmp_path / "plugins.json"
+    manifest.write_text("{not json")
+    registry = ToolRegistry(manifest_path=str(manifest))
+    registry.load_all_plugins(str(base_dir))
+    assert "tmux-list" in registry
+
+
+def test_duplicate_tool_name_is_rejected(base_dir, tmp_path):
+    registry = ToolRegistry(manifest_path=str(tmp_path / "plugins.json"))
+    registry.load_all_plugins(str(base_dir))
+    tool = registry.get_tool("tmux-list")
+
+    with pytest.raises(ValueError):
+        registry.register(type(tool)())
+    assert registry.get_tool("tmux-list") is tool
+    assert registry.list_by_category("tmux").count("tmux-list") == 1
+
+
+def test_unserializable_scan_does_not_break_loading(tmp_path):
+    manifest = tmp_path / "plugins.json"
+    registry = ToolRegistry(manifest_path=str(manifest))
+    registry._scans = {"/plugin.py": [0, 0, [["SetTool", {"choices": {1, 2}}]]]}
+    registry._scans_dirty = True
+
+    registry._save_manifest()
+    assert not manifest.exists()
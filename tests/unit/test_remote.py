@@ -0,0 +1,39 @@
+"""
+Unit tests for the SSH connection-sharing directory
+"""
+
+import os
+
+import pytest
+
+from pty_mcp_server.lib import remote
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    """Point XDG_RUNTIME_DIR at a temporary directory and forget the cached choice"""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr(remote, "_control_dir", None)
+    return tmp_path
+
+
+def test_control_dir_is_created_private(runtime_dir):
+    options = remote.ssh_control_options()
+    control_dir = runtime_dir / "ptymcp-ssh"
+    assert f"ControlPath={control_dir / '%C'}" in options
+    assert control_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_shared_control_dir_disables_multiplexing(runtime_dir):
+    control_dir = runtime_dir / "ptymcp-ssh"
+    control_dir.mkdir()
+    control_dir.chmod(0o777)
+    assert remote.ssh_control_options() == ()
+    assert remote.ssh_control_dir() is None
+
+
+def test_symlinked_control_dir_disables_multiplexing(runtime_dir, tmp_path_factory):
+    target = tmp_path_factory.mktemp("elsewhere")
+    target.chmod(0o700)
+    os.symlink(target, runtime_dir / "ptymcp-ssh")
+    assert remote.ssh_control_options() == ()
@@ -0,0 +1,33 @@
+"""
+Unit tests for SocketSession reads
+"""
+
+import socket
+
+from pty_mcp_server.core.sessions.socket import SocketSession
+
+
+def test_read_waits_for_split_utf8_character():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    session = SocketSession()
+    try:
+        session.open("127.0.0.1", server.getsockname()[1])
+        peer, _ = server.accept()
+        encoded = "é".encode("utf-8")
+
+        # Only half a character: nothing to return yet
+        peer.sendall(encoded[:1])
+        assert session.read(0.1) == "(no data received within timeout)"
+
+        peer.sendall(encoded[1:] + b"!")
+        assert session.read(1.0) == "é!"
+
+        # A partial character left when the peer closes is not lost
+        peer.sendall(b"x" + encoded[:1])
+        peer.close()
+        assert session.read_until_quiet(1.0) == "x�"
+    finally:
+        session.close()
+        server.close()
@@ -0,0 +1,20 @@
+"""
+Unit tests for Telnet IAC handling
+"""
+
+from pty_mcp_server.plugins.network.socket_telnet import SocketTelnetTool
+
+
+def test_remove_iac_sequences():
+    tool = SocketTelnetTool()
+    strip = tool.remove_iac_sequences
+
+    assert strip(b"plain text") == b"plain text"
+    # Option negotiation, with and without a trailing option byte
+    assert strip(b"a\xff\xfb\x01b\xff\xfd") == b"ab"
+    # Subnegotiation is dropped through IAC SE
+    assert strip(b"a\xff\xfa\x18\x01\xff\xf0b") == b"ab"
+    # Unterminated subnegotiation drops only IAC SB
+    assert strip(b"a\xff\xfa\x18b") == b"a\x18b"
+    # Escaped 255, other two-byte commands and a lone trailing IAC
+    assert strip(b"a\xff\xffb\xff\xf1c\xff") == b"a\xffbc"
@@ -0,0 +1,37 @@
+"""
+Unit tests for terminal tools without a running PTY
+"""
+
+import pytest
+
+from pty_mcp_server.core.manager import SessionManager
+from pty_mcp_server.lib.config import ProjectConfig
+from pty_mcp_server.plugins.terminal.clear import ClearTool
+from pty_mcp_server.plugins.terminal.resize import ResizeTool
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """SessionManager with an isolated config and no warmup"""
+    config = ProjectConfig(
+        base_dir=str(tmp_path),
+        config_path=str(tmp_path / "projects.json"),
+        state_path=str(tmp_path / ".active_project"),
+        projects={}
+    )
+    return SessionManager(config)
+
+
+@pytest.mark.parametrize("idle_session", [False, True])
+def test_tools_require_active_pty(manager, idle_session):
+    if idle_session:
+        # An idle session object, as PTY_MCP_WARMUP leaves behind
+        manager.get_pty_session()
+
+    result = ClearTool(manager).execute({})
+    assert not result.success
+    assert result.error == "No active PTY session to clear"
+
+    result = ResizeTool(manager).execute({"width": 100, "height": 30})
+    assert not result.success
+    assert result.error == "No active PTY session to resize"
@@ -0,0 +1,63 @@
+"""
+Unit tests for TmuxSessionManager that do not need a tmux server
+"""
+
+import subprocess
+
+from pty_mcp_server.core.sessions.tmux import TmuxSessionManager
+from pty_mcp_server.core.sessions.tmux_control import (
+    CONTROL_SESSION, TmuxControlError, TmuxReplyLost
+)
+
+
+class FailingControl:
+    """Stands in for TmuxControlClient and fails every command"""
+
+    def __init__(self, error):
+        self.error = error
+
+    def run(self, args):
+        raise self.error
+
+    def close(self):
+        pass
+
+
+def test_control_session_is_reserved():
+    manager = TmuxSessionManager()
+    for target in (CONTROL_SESSION, f"={CONTROL_SESSION}", f"{CONTROL_SESSION}:0.0"):
+        assert manager.session_exists(target) is False
+        for result in (manager.start_session(target, "sh"),
+                       manager.send_keys(target, "echo"),
+                       manager.capture_pane(target),
+                       manager.get_attach_command(target),
+                       manager.kill_session(target)):
+            assert not result["success"]
+            assert "reserved" in result["error"]
+
+
+def test_sent_command_is_not_rerun(monkeypatch):
+    manager = TmuxSessionManager()
+    manager._control = FailingControl(TmuxReplyLost("tmux control client did not respond"))
+    def rerun(*args, **kwargs):
+        raise AssertionError("command was run a second time")
+
+    monkeypatch.setattr(subprocess, "run", rerun)
+
+    result = manager.send_keys("demo", "echo hi")
+    assert not result["success"]
+    assert "did not respond" in result["error"]
+
+
+def test_unsent_command_falls_back(monkeypatch):
+    manager = TmuxSessionManager()
+    manager._control = FailingControl(TmuxControlError("could not start"))
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, b"", b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    assert manager.send_keys("demo", "echo hi")["success"]
+    assert calls == [["tmux", "send-keys", "-t", "demo", "echo hi", "Enter"]]